@@ -0,0 +1,58 @@
+"""Keyword relevance scoring helpers for batch/offline use.
+
+The online coach path scores one message at a time with a short-circuit
+loop; evaluation sweeps and backlog replays score thousands. For those,
+this module exposes a vectorized scorer that JIT-compiles with Numba
+when it is installed and falls back to NumPy otherwise. Compilation is
+lazy so the JIT cost never lands on the online path.
+"""
+
+import numpy as np
+
+# Numba is optional - evaluation environments may install it for speed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator when Numba is unavailable."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def score(matches: np.ndarray, weight: float) -> float:
+    """Score one message from its keyword-match vector.
+
+    Args:
+        matches: uint8 vector, 1 where a keyword matched
+        weight: contribution of each matched keyword
+
+    Returns:
+        Relevance score, capped at 1.0
+    """
+    total = 0.0
+    for i in range(matches.size):
+        total += matches[i] * weight
+    if total > 1.0:
+        return 1.0
+    return total
+
+
+def score_batch(matches_2d: np.ndarray, weight: float) -> np.ndarray:
+    """Score a batch of messages from a (n_messages, n_keywords) matrix.
+
+    Args:
+        matches_2d: uint8 matrix, 1 where a keyword matched
+        weight: contribution of each matched keyword
+
+    Returns:
+        Array of relevance scores, each capped at 1.0
+    """
+    totals = matches_2d.astype(np.float64).sum(axis=1) * weight
+    return np.minimum(totals, 1.0)
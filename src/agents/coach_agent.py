@@ -1,27 +1,105 @@
-"""Diary Coach agent implementation with Michael's coaching prompt."""
-
-from typing import List, Dict, Any, Optional
+"""Diary Coach agent implementation with Michael's coaching prompt.
+
+Prompt-assembly invariant: provider prompt caches key on the longest
+common prefix, so all static content (base system prompt, morning
+addition) must come first and anything dynamic (todo context,
+timestamps) must trail it. A single dynamic byte at position 0 would
+invalidate the cached prefix on every turn - keep new prompt sections
+at the end unless they are byte-stable across a conversation.
+"""
+
+import asyncio
+import logging
+import re
+from collections import deque
+from time import monotonic
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, time
 from src.agents.base import BaseAgent, AgentCapability, AgentRequest, AgentResponse
 from src.events.schemas import UserMessage
 from src.services.llm_service import AnthropicService
 from src.agents.prompts import get_coach_system_prompt, get_coach_morning_protocol
 from src.orchestration.mcp_todo_node import MCPTodoNode
-from src.orchestration.context_state import ContextState
+
+logger = logging.getLogger(__name__)
+
+# Keywords signalling the message is about tasks/priorities; compiled
+# once so each message needs a single scan instead of one per keyword.
+# A compiled alternation gives the same one-sweep behavior as an
+# Aho-Corasick automaton for this keyword count without pulling in a
+# C-extension dependency; sre walks the input once with first-char
+# skipping, so cost stays linear in message length
+TASK_KEYWORDS = (
+    "prioritize", "today", "should", "work", "task", "do",
+    "list", "priority", "focus", "challenge", "important",
+    "tackle", "problem", "goal"
+)
+_TASK_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, TASK_KEYWORDS)) + r")\b",
+    re.IGNORECASE
+)
+
+# Relevance scoring: each distinct keyword contributes KEYWORD_WEIGHT,
+# and todos are fetched once the score reaches RELEVANCE_THRESHOLD
+KEYWORD_WEIGHT = 0.15
+RELEVANCE_THRESHOLD = 0.3
+# Distinct matches needed to cross the threshold (ceil(0.3 / 0.15))
+_ENOUGH_MATCHES = 2
+
+# Morning window bounds (6:00 AM - 11:59 AM), built once
+_MORNING_START = time(6, 0)
+_MORNING_END = time(11, 59)
+
+# Morning-info indicators fused into one compiled union: a single
+# C-level scan classifies challenge and value hits together via named
+# groups, with no lowered copy or tokenization of the message needed
+_MORNING_INFO_RE = re.compile(
+    r"(?P<challenge>\b(?:problem|challenge|issue|struggle|difficult|"
+    r"organize|need\s+to|want\s+to|have\s+to|should)\b)"
+    r"|(?P<value>\b(?:value|fight\s+for|champion|believe|important|"
+    r"matter|care\s+about|clarity|freedom|growth)\b)",
+    re.IGNORECASE
+)
+
+# Morning greeting detector. Greetings open a message, so the scan is
+# bounded to the first _GREETING_SCAN chars instead of lowercasing and
+# scanning the full message body
+_GREETING_RE = re.compile(r"\bgood\s+morning\b", re.IGNORECASE)
+_GREETING_SCAN = 64
+
+# Shared across coach instances so server-path detection and env
+# resolution happen once per process, not per conversation. Session
+# setup/teardown stays per-fetch: keeping a warm stdio session open
+# across turns trips anyio cancel-scope cleanup (see docs/MCP_howto.md).
+_TODO_NODE: Optional[MCPTodoNode] = None
+
+
+def get_todo_node() -> MCPTodoNode:
+    """Return the process-wide shared MCPTodoNode."""
+    global _TODO_NODE
+    if _TODO_NODE is None:
+        _TODO_NODE = MCPTodoNode()
+    return _TODO_NODE
 
 
 class DiaryCoach(BaseAgent):
     """Michael's personal Daily Transformation Diary Coach."""
 
+    # Keep at most this many messages in history before summarizing old ones
+    HISTORY_LIMIT = 50
+
+    # Serve repeat MCP todo fetches from memory within this window
+    TODO_CACHE_TTL_SECONDS = 60.0
+
     @property
     def SYSTEM_PROMPT(self) -> str:
-        """Load the system prompt from the master prompt file."""
-        return get_coach_system_prompt()
+        """The system prompt, loaded once from the master prompt file."""
+        return self._base_prompt
 
     @property
     def MORNING_PROMPT_ADDITION(self) -> str:
-        """Load the morning protocol from the master prompt file."""
-        return get_coach_morning_protocol()
+        """The morning protocol, loaded once from the master prompt file."""
+        return self._morning_addition
 
     def __init__(self, llm_service: AnthropicService):
         """Initialize the diary coach.
@@ -34,157 +112,375 @@ class DiaryCoach(BaseAgent):
             capabilities=[AgentCapability.CONVERSATION]
         )
         self.llm_service = llm_service
+        # Cache prompts once; property access is then attribute lookup
+        self._base_prompt = get_coach_system_prompt()
+        self._morning_addition = get_coach_morning_protocol()
+        self._compose_prompts()
         self.conversation_state = "general"  # general, morning
         self.morning_challenge: Optional[str] = None
         self.morning_value: Optional[str] = None
-        self.message_history: List[Dict[str, str]] = []
-        self.mcp_todo_node = MCPTodoNode()  # Real MCP integration
+        # Bounded: O(1) append with automatic eviction as a hard cap;
+        # the housekeeping worker summarizes before the cap is reached
+        self.message_history: deque = deque(maxlen=2 * self.HISTORY_LIMIT)
+        self.history_summary: Optional[str] = None
+        self.mcp_todo_node = get_todo_node()  # Shared real MCP integration
+        # (fetched_at, todo_context) from the last successful MCP fetch
+        self._todo_cache: Optional[tuple] = None
+        # In-flight speculative refresh of the todo cache, if any
+        self._todo_prefetch: Optional[asyncio.Task] = None
+        # (fingerprint, rendered) for the last todo prompt section
+        self._todo_text_cache: Optional[tuple] = None
+        # History housekeeping (trimming/summarization) runs off the
+        # response-critical path via a producer/consumer queue
+        self._history_queue: asyncio.Queue = asyncio.Queue()
+        self._housekeeper: Optional[asyncio.Task] = None
+
+    def _compose_prompts(self) -> None:
+        """Precompute both prompt variants so per-turn selection is a
+        boolean pick instead of a multi-KB concatenation."""
+        self._prompt_day = self._base_prompt
+        self._prompt_morning = (
+            self._base_prompt + "\n\n" + self._morning_addition
+        )
+        base_block = {
+            "type": "text",
+            "text": self._base_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }
+        morning_block = {
+            "type": "text",
+            "text": self._morning_addition,
+            "cache_control": {"type": "ephemeral"}
+        }
+        self._static_blocks_day = [base_block]
+        self._static_blocks_morning = [base_block, morning_block]
+
+    def _is_morning_time(self, now: Optional[datetime] = None) -> bool:
+        """Check if current time is morning (6:00 AM - 11:59 AM).
 
-    def _is_morning_time(self) -> bool:
-        """Check if current time is morning (6:00 AM - 11:59 AM)."""
-        current_time = datetime.now().time()
-        morning_start = time(6, 0)  # 6:00 AM
-        morning_end = time(11, 59)  # 11:59 AM
-        return morning_start <= current_time <= morning_end
+        Args:
+            now: Optional pre-captured timestamp; callers that already
+                hold one for the turn pass it to avoid a second clock
+                read
+        """
+        current_time = (now or datetime.now()).time()
+        return _MORNING_START <= current_time <= _MORNING_END
 
     def _get_system_prompt(self) -> str:
         """Get the appropriate system prompt based on time of day."""
-        base_prompt = self.SYSTEM_PROMPT
         if self._is_morning_time():
-            return base_prompt + "\n\n" + self.MORNING_PROMPT_ADDITION
-        return base_prompt
+            return self._prompt_morning
+        return self._prompt_day
 
     async def _get_todo_context(
         self, message: UserMessage
     ) -> Optional[List[Dict[str, Any]]]:
         """Get relevant todos based on message content."""
-        try:
-            # Check if the message is asking about tasks/priorities
-            content_lower = message.content.lower()
-            task_keywords = [
-                "prioritize", "today", "should", "work", "task", "do",
-                "list", "priority", "focus", "challenge", "important",
-                "tackle", "problem", "goal"
-            ]
-
-            # Calculate relevance score
-            relevance_score = sum(
-                0.15 for keyword in task_keywords if keyword in content_lower
-            )
-            relevance_score = min(relevance_score, 1.0)
-
-            if relevance_score >= 0.3:  # Lower threshold for direct integration
-                # Create a context state for MCP fetching
-                state = ContextState(
-                    messages=[{
-                        "type": "user",
-                        "content": message.content,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    context_relevance={"todos": relevance_score},
-                    conversation_id=message.conversation_id
-                )
+        # Keyword scanning is pure computation and cannot raise - keep
+        # it outside the try so the handler only guards the MCP I/O.
+        # Guard the content type first: some callers hand through
+        # non-string payloads, which simply carry no todo signal
+        content = message.content
+        if not isinstance(content, str):
+            return None
 
-                # Fetch todos using MCP
-                result_state = await self.mcp_todo_node.fetch_todos(state)
-                return result_state.todo_context
-            else:
-                return None
-        except Exception:
-            # Log error but don't break the conversation
+        # Fast path: pure-conversation messages (no task keyword at
+        # all) bail out on a single regex scan, before any set or
+        # state allocation
+        if _TASK_RE.search(content) is None:
             return None
 
-    def _get_system_prompt_with_context(
-        self, todo_context: Optional[List[Dict[str, Any]]]
-    ) -> str:
-        """Enhance system prompt with todo context if available."""
-        base_prompt = self._get_system_prompt()
+        # Full score: count distinct keywords, stopping as soon as
+        # enough have matched to cross the fetch threshold
+        matches = set()
+        for m in _TASK_RE.finditer(content):
+            matches.add(m.group().lower())
+            if len(matches) >= _ENOUGH_MATCHES:
+                break
+        # No 1.0 cap needed: the loop breaks at _ENOUGH_MATCHES, so
+        # the score tops out at _ENOUGH_MATCHES * KEYWORD_WEIGHT
+        relevance_score = len(matches) * KEYWORD_WEIGHT
+        if relevance_score < RELEVANCE_THRESHOLD:
+            return None
 
-        if not todo_context:
-            return base_prompt
-
-        # Format todos for context
-        context_items = []
-        if todo_context:
-            formatted_todos = "\n".join([
-                f"- {todo.get('content', 'No content')} "
-                f"[{todo.get('priority', 'normal')} priority]"
-                for todo in todo_context[:5]  # Limit to top 5
-            ])
-            num_todos = len(todo_context)
-            context_items.append(
-                f"Current Tasks ({num_todos} items):\n{formatted_todos}"
-            )
+        # Serve from the short-TTL cache when the last fetch is
+        # fresh - Todoist state rarely changes within a minute
+        cached_todos = self._cached_todos()
+        if cached_todos is not None:
+            return cached_todos
 
-        if context_items:
-            context_text = "\n\n".join(context_items)
-            return (
-                "Here is some current context about the user that may be "
-                "relevant to your conversation:\n\n"
-                f"{context_text}\n\n{base_prompt}"
-            )
+        try:
+            # Ride an in-flight speculative refresh instead of opening
+            # a second MCP session for the same data
+            if (self._todo_prefetch is not None
+                    and not self._todo_prefetch.done()):
+                await self._todo_prefetch
+                cached_todos = self._cached_todos()
+                if cached_todos is not None:
+                    return cached_todos
+
+            return await self._fetch_and_cache_todos(message)
+        except Exception as e:
+            # Degrade gracefully: surface the MCP failure in the logs
+            # and fall back to the last known todo list (even past its
+            # TTL) so coaching context and the prompt stay stable
+            logger.warning("MCP todo fetch failed: %s", e)
+            if self._todo_cache is not None:
+                return self._todo_cache[1]
+            return None
 
-        return base_prompt
+    def _cached_todos(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached todo list if still within its TTL."""
+        if self._todo_cache is None:
+            return None
+        fetched_at, cached_todos = self._todo_cache
+        if monotonic() - fetched_at < self.TODO_CACHE_TTL_SECONDS:
+            return cached_todos
+        return None
 
-    def _inject_todo_context(
-        self, prompt: str, todo_context: Optional[List[Dict[str, Any]]]
-    ) -> str:
-        """Inject todo context directly into the prompt if available."""
-        if not todo_context:
-            return prompt
-
-        # Build detailed todo text
-        todo_text = "\n\n---\nCURRENT CONTEXT - Michael's Active Tasks:\n\n"
-        for i, todo in enumerate(todo_context[:10], 1):  # Show up to 10 todos
-            due_info = ""
-            if todo.get('due_date') and todo.get('due_date') != 'None':
-                due_info = f" (Due: {todo.get('due_date')})"
-            priority = todo['priority']
-            todo_text += f"{i}. {todo['content']} - {priority} priority{due_info}\n"
-            todo_text += f"   Project: {todo.get('project', 'Inbox')}\n"
-
-        todo_text += (
-            "\nUse this context to provide more relevant coaching about his "
-            "actual priorities and tasks. Reference specific tasks when "
-            "appropriate, but don't just list them - integrate them naturally "
-            "into your coaching conversation through inquiry.\n"
+    async def _fetch_and_cache_todos(
+        self, message: UserMessage
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch todos in one MCP session and refresh the short-TTL
+        cache. Uses the raw MCP entry point: relevance was already
+        gated here, so no ContextState allocation or usage bookkeeping
+        is paid on the hot path."""
+        todos = await self.mcp_todo_node.fetch_bundle_raw(message.content)
+        self._todo_cache = (monotonic(), todos)
+        return todos
+
+    def _maybe_prefetch_todos(self, message: UserMessage) -> None:
+        """Speculatively refresh the todo cache in the background.
+
+        Scheduled after a response is sent so the next task-relevant
+        turn finds a warm cache and skips the MCP round-trip. Only
+        fires when todos are already in play for this conversation and
+        the cache is past half its TTL - pure-conversation sessions
+        never touch MCP.
+        """
+        if self._todo_cache is None:
+            return
+        fetched_at, _ = self._todo_cache
+        if monotonic() - fetched_at < self.TODO_CACHE_TTL_SECONDS / 2:
+            return
+        if self._todo_prefetch is not None and not self._todo_prefetch.done():
+            return
+        self._todo_prefetch = asyncio.create_task(
+            self._prefetch_todos(message)
         )
 
-        enhanced_prompt = prompt + todo_text
-        return enhanced_prompt
-
-    def _extract_morning_info(self, content: str, info_type: str) -> Optional[str]:
-        """Extract morning challenge or value from conversation."""
-        content_lower = content.lower()
-        if info_type == "challenge":
-            # Look for problem/challenge indicators
-            if any(word in content_lower for word in [
-                "problem", "challenge", "issue", "struggle", "difficult",
-                "organize", "need to", "want to", "have to", "should"
-            ]):
-                return content
-        elif info_type == "value":
-            # Look for value indicators
-            if any(word in content_lower for word in [
-                "value", "fight for", "champion", "believe", "important",
-                "matter", "care about", "clarity", "freedom", "growth"
-            ]):
-                return content
-        return None
+    async def _prefetch_todos(self, message: UserMessage) -> None:
+        """Background body of the speculative refresh; failures leave
+        the existing cache in place."""
+        try:
+            await self._fetch_and_cache_todos(message)
+        except Exception:
+            pass
 
+    def _format_todo_context(
+        self, todo_context: Optional[List[Dict[str, Any]]]
+    ) -> Optional[str]:
+        """Format todo context as a prompt section, or None if empty.
+
+        The rendered section is memoized on a fingerprint of the todos
+        shown, so repeat turns with the same list (common within the
+        fetch TTL) skip the re-render and keep the prompt byte-stable
+        for Anthropic's cache.
+        """
+        if not todo_context:
+            return None
+
+        # Key on every field the rendering shows (plus id/due_date) so
+        # any visible change on a shown task invalidates the memo.
+        # MCPTodoNode normalizes todos to always carry these keys, so
+        # plain indexing replaces chained .get() fallbacks
+        shown = todo_context[:5]  # Limit to top 5
+        fingerprint = tuple(
+            (todo["id"], todo["due_date"],
+             todo["content"], todo["priority"])
+            for todo in shown
+        )
+        if (self._todo_text_cache is not None
+                and self._todo_text_cache[0] == fingerprint):
+            return self._todo_text_cache[1]
+
+        formatted_todos = "\n".join([
+            f"- {todo['content']} [{todo['priority']} priority]"
+            for todo in shown
+        ])
+        num_todos = len(todo_context)
+        rendered = (
+            "Here is some current context about the user that may be "
+            "relevant to your conversation:\n\n"
+            f"Current Tasks ({num_todos} items):\n{formatted_todos}"
+        )
+        self._todo_text_cache = (fingerprint, rendered)
+        return rendered
+
+    def _get_system_blocks(
+        self,
+        todo_context: Optional[List[Dict[str, Any]]],
+        is_morning: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Build structured system blocks with Anthropic prompt caching.
+
+        The static base prompt (and morning addition) carry cache_control
+        markers so the API reuses the cached prefix on subsequent turns;
+        the dynamic todo block stays last and uncached so it never breaks
+        the stable prefix.
+
+        Anthropic allows at most 4 cache breakpoints per request. We
+        spend up to 3: base prompt, morning addition, and the
+        conversation-history breakpoint set by AnthropicService -
+        leaving one spare before new markers start getting rejected.
+        """
+        if is_morning is None:
+            is_morning = self._is_morning_time()
+        if is_morning:
+            blocks = list(self._static_blocks_morning)
+        else:
+            blocks = list(self._static_blocks_day)
+        todo_text = self._format_todo_context(todo_context)
+        if todo_text:
+            blocks.append({"type": "text", "text": todo_text})
+        return blocks
+
+    def _extract_morning_info_both(
+        self, content: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Extract morning challenge and value in one pass.
+
+        Returns:
+            (challenge, value) - each is the full content when its
+            indicators matched, else None. The scan stops as soon as
+            both categories have hit.
+        """
+        challenge: Optional[str] = None
+        value: Optional[str] = None
+        for match in _MORNING_INFO_RE.finditer(content):
+            if match.lastgroup == "challenge":
+                challenge = content
+            else:
+                value = content
+            if challenge is not None and value is not None:
+                break
+        return challenge, value
+
+    def reload_prompts(self) -> None:
+        """Re-read prompt files from disk (hot-reload hook)."""
+        from src.agents.prompts import PromptLoader
+        PromptLoader.clear_cache()
+        self._base_prompt = get_coach_system_prompt()
+        self._morning_addition = get_coach_morning_protocol()
+        self._compose_prompts()
 
     def reset_conversation(self):
         """Reset conversation state and history."""
         self.conversation_state = "general"
         self.morning_challenge = None
         self.morning_value = None
-        self.message_history = []
+        self.message_history = deque(maxlen=2 * self.HISTORY_LIMIT)
+        self.history_summary = None
+        self._todo_cache = None
+        self._todo_text_cache = None
+        if self._todo_prefetch is not None:
+            self._todo_prefetch.cancel()
+            self._todo_prefetch = None
+
+    async def process_message_stream(
+        self, message: UserMessage
+    ) -> AsyncIterator[str]:
+        """Stream a coaching response, yielding text deltas as they
+        arrive while accumulating the full reply for history."""
+        user_entry = {"role": "user", "content": message.content}
+        self.message_history.append(user_entry)
+        self._enqueue_history(user_entry)
+
+        # One clock read covers the turn's time-of-day classification
+        now = datetime.now()
+        is_morning = self._is_morning_time(now)
+        todo_task = asyncio.create_task(self._get_todo_context(message))
+
+        # The user entry was appended above, so the deque already ends
+        # with this turn's message - one copy, no slice+concat
+        messages = list(self.message_history)
+
+        todo_context = await todo_task
+        system_prompt = self._get_system_blocks(todo_context, is_morning)
+
+        parts: List[str] = []
+        async for delta in self.llm_service.generate_response_stream(
+            messages=messages,
+            system_prompt=system_prompt,
+            max_tokens=2000,
+            temperature=0.7
+        ):
+            parts.append(delta)
+            yield delta
+
+        assistant_entry = {
+            "role": "assistant",
+            "content": "".join(parts)
+        }
+        self.message_history.append(assistant_entry)
+        self._enqueue_history(assistant_entry)
 
     async def initialize(self) -> None:
         """Initialize the agent with any required resources."""
         # Initialize MCP connection if needed
+        if self._housekeeper is None:
+            self._housekeeper = asyncio.create_task(self._history_worker())
         self.is_initialized = True
 
+    async def shutdown(self) -> None:
+        """Drain pending history housekeeping and stop the worker."""
+        if self._housekeeper is not None:
+            await self._history_queue.join()
+            self._housekeeper.cancel()
+            self._housekeeper = None
+        if self._todo_prefetch is not None:
+            self._todo_prefetch.cancel()
+            self._todo_prefetch = None
+
+    def _enqueue_history(self, entry: Dict[str, str]) -> None:
+        """Queue a history entry, starting the housekeeper on first use.
+
+        Callers that never ran initialize() (eval harnesses construct
+        the coach and drive turns directly) still get trimming and
+        summarization instead of an unconsumed queue.
+        """
+        if self._housekeeper is None or self._housekeeper.done():
+            self._housekeeper = asyncio.create_task(self._history_worker())
+        self._history_queue.put_nowait(entry)
+
+    async def _history_worker(self) -> None:
+        """Consume queued messages and trim/summarize history off-path."""
+        while True:
+            item = await self._history_queue.get()
+            try:
+                self._maybe_summarize(item)
+            except Exception:
+                # A bad item must not kill the worker: shutdown()
+                # joins the queue and would wait forever without a
+                # consumer
+                logger.exception("History housekeeping failed")
+            finally:
+                self._history_queue.task_done()
+
+    def _maybe_summarize(self, item: Dict[str, str]) -> None:
+        """Trim history beyond the limit, folding dropped messages into
+        a running summary so context isn't silently lost."""
+        overflow = len(self.message_history) - self.HISTORY_LIMIT
+        if overflow <= 0:
+            return
+        dropped = [self.message_history.popleft() for _ in range(overflow)]
+        summary_lines = [
+            f"{msg['role']}: {msg['content'][:100]}" for msg in dropped
+        ]
+        if self.history_summary:
+            summary_lines.insert(0, self.history_summary)
+        self.history_summary = "\n".join(summary_lines)
+
     async def handle_request(self, request: AgentRequest) -> AgentResponse:
         """Handle a request from another agent or the orchestrator.
 
@@ -195,37 +491,56 @@ class DiaryCoach(BaseAgent):
             AgentResponse with the result or error
         """
         try:
-            # Add message to history
-            self.message_history.append({
-                "role": "user",
-                "content": request.query
-            })
-
-            # Create UserMessage for todo context checking
+            # Add message to history; trimming happens in the background
+            user_entry = {"role": "user", "content": request.query}
+            self.message_history.append(user_entry)
+            self._enqueue_history(user_entry)
+
+            # One clock read covers message defaults, morning
+            # classification and the MCP state timestamp
+            now = datetime.now()
+
+            # Create UserMessage for todo context checking. Defaults
+            # are built lazily: dict.get's second argument would be
+            # evaluated even when the key exists, so format/parse work
+            # only happens on an actual miss
+            context_timestamp = request.context.get("timestamp")
             user_message = UserMessage(
                 content=request.query,
                 user_id=request.context.get("user_id", "michael"),
                 conversation_id=request.context.get(
                     "conversation_id", "default"
                 ),
-                message_id=request.context.get(
-                    "message_id", str(datetime.now().timestamp())
+                message_id=(
+                    request.context.get("message_id")
+                    or str(now.timestamp())
                 ),
-                timestamp=datetime.fromisoformat(
-                    request.context.get("timestamp", datetime.now().isoformat())
+                timestamp=(
+                    datetime.fromisoformat(context_timestamp)
+                    if context_timestamp else now
                 )
             )
 
-            # Get todo context if relevant
-            todo_context = await self._get_todo_context(user_message)
+            # Classify time of day once for the whole turn
+            is_morning = self._is_morning_time(now)
+
+            # Kick off the MCP todo fetch so it overlaps with prompt
+            # assembly instead of blocking it. If more independent
+            # fetches join this path (memory recall, document context),
+            # await them together via asyncio.gather rather than
+            # serializing the awaits
+            todo_task = asyncio.create_task(
+                self._get_todo_context(user_message)
+            )
 
-            # Get system prompt with embedded context
-            system_prompt = self._get_system_prompt_with_context(todo_context)
+            # Prepare messages for LLM service: the user entry was
+            # appended above, so the deque already ends with this
+            # turn's message - one copy, no slice+concat
+            messages = list(self.message_history)
 
-            # Prepare messages for LLM service
-            messages = self.message_history[:-1] + [
-                {"role": "user", "content": request.query}
-            ]
+            # Build system blocks with embedded context (cached prefix)
+            todo_context = await todo_task
+            system_prompt = self._get_system_blocks(todo_context, is_morning)
 
             # Generate response using LLM service
             response_content = await self.llm_service.generate_response(
@@ -236,27 +551,32 @@ class DiaryCoach(BaseAgent):
             )
 
             # Update conversation state and extract info
-            if self._is_morning_time():
+            if is_morning:
                 if (self.conversation_state == "general" and
-                        "morning" in request.query.lower()):
+                        _GREETING_RE.search(
+                            request.query[:_GREETING_SCAN])):
                     self.conversation_state = "morning"
-                # Extract challenge and value regardless of when they appear
-                extracted_challenge = self._extract_morning_info(
-                    request.query, "challenge"
+                # Extract challenge and value regardless of when they
+                # appear - both come from one scan of the query
+                extracted_challenge, extracted_value = (
+                    self._extract_morning_info_both(request.query)
                 )
                 if extracted_challenge and not self.morning_challenge:
                     self.morning_challenge = extracted_challenge
-                extracted_value = self._extract_morning_info(
-                    request.query, "value"
-                )
                 if extracted_value and not self.morning_value:
                     self.morning_value = extracted_value
 
-            # Update history with response
-            self.message_history.append({
+            # Update history with response; housekeeping stays off-path
+            assistant_entry = {
                 "role": "assistant",
                 "content": response_content
-            })
+            }
+            self.message_history.append(assistant_entry)
+            self._enqueue_history(assistant_entry)
+
+            # Warm the todo cache for the next turn while the user is
+            # reading this response
+            self._maybe_prefetch_todos(user_message)
 
             # Create response
             return AgentResponse(
@@ -268,7 +588,7 @@ class DiaryCoach(BaseAgent):
                     "morning_value": self.morning_value
                 },
                 request_id=request.request_id,
-                timestamp=datetime.now()
+                timestamp=now
             )
         except Exception as e:
             return AgentResponse(
@@ -1,7 +1,14 @@
 """Enhanced Diary Coach agent with multi-agent collaboration capabilities."""
 
+import asyncio
+import hashlib
+import json
 import os
-from typing import List, Dict, Any, Optional, Set
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -29,15 +36,117 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Trigger keywords per collaborating agent, compiled once into single
+# case-insensitive alternations so each check is one C-level scan of
+# the message instead of one Python substring test per keyword. Plain
+# substring semantics (no word boundaries) are preserved - "priorit"
+# deliberately matches "priority"/"priorities"
+_AGENT_TRIGGER_RES: Dict[str, "re.Pattern"] = {
+    "memory": re.compile(
+        r"remember when|last time|previously|before|past conversation|"
+        r"we discussed|you mentioned",
+        re.IGNORECASE
+    ),
+    "personal_content": re.compile(
+        r"belief|value|core|philosophy|principle|my approach|"
+        r"i believe|important to me",
+        re.IGNORECASE
+    ),
+    "mcp": re.compile(
+        r"task|todo|priorit|should i work|what to do|today|deadline|"
+        r"project|focus on|tackle",
+        re.IGNORECASE
+    ),
+}
+
+# Union of every category's triggers: one scan decides whether any
+# per-category check is worth running at all
+_ANY_TRIGGER_RE = re.compile(
+    "|".join(p.pattern for p in _AGENT_TRIGGER_RES.values()),
+    re.IGNORECASE
+)
+
+# Morning greeting variants; longest first so e.g. "good morning"
+# reports the full phrase rather than the "gm" fragment
+_MORNING_RE = re.compile(
+    r"good morning|goodmorning|g'morning|mornin|morning|gm",
+    re.IGNORECASE
+)
+
+
+def multi_agent_enabled() -> bool:
+    """Read the DISABLE_MULTI_AGENT kill switch from the environment.
+
+    Shared by the coach and the CLI so both resolve the flag the same
+    way; read at construction time, after which hot paths check the
+    instance attribute only.
+    """
+    return os.getenv("DISABLE_MULTI_AGENT", "false").strip().lower() != "true"
+
+
+# Phase-2 acceptance: single affirmations and multi-word phrases in
+# one word-boundary scan, so "Yes!" and "Okay." still match
+_ACCEPT_RE = re.compile(
+    r"\b(?:yes|sure|okay|ok|ready|let's do it|i'm ready|sounds good"
+    r"|go ahead|deeper questions)\b",
+    re.IGNORECASE
+)
+
+# Pulls the crux phrase out of "the crux ...: <phrase>" in a response
+_CRUX_RE = re.compile(r'crux[^:]*:([^.!?]+)', re.IGNORECASE)
+
+# Static trailer appended after any rendered agent context
+_CONTEXT_USAGE_INSTRUCTIONS = (
+    "\n\n"
+    "## Context Usage Instructions:\n"
+    "- When user asks 'what should I work on' or about tasks: "
+    "Reference the ACTUAL tasks above, not examples\n"
+    "- When user asks about beliefs/values: Use the ACTUAL personal "
+    "context above\n"
+    "- Integrate this real data naturally into your coaching questions\n"
+    "- NEVER make up example tasks or beliefs when real data is provided"
+)
+
+# Cap on retained conversation messages (25 user/assistant turns).
+# Bounds both process memory and the prompt sent to Anthropic over
+# long sessions; crux and morning challenge live in dedicated fields,
+# so trimming old turns never loses them
+_MAX_HISTORY_MESSAGES = 50
+
+
+@dataclass(slots=True)
+class CoachResponseMetadata:
+    """Per-turn response metadata.
+
+    Slotted so each turn allocates fixed-size storage instead of a
+    fresh dict; converted to a dict only at the AgentResponse edge.
+    """
+    conversation_state: str
+    morning_challenge: Optional[str]
+    morning_value: Optional[str]
+    agents_called: List[str]
+    agent_calls_made: int
+    current_stage: int
+    problem_identified: bool
+
 
 class EnhancedDiaryCoach(BaseAgent):
     """Enhanced coach with ability to call other agents during Stage 1."""
 
     @property
     def SYSTEM_PROMPT(self) -> str:
-        """Load the system prompt from the master prompt file."""
+        """The system prompt, loaded once at construction."""
+        return self._base_prompt
+
+    @property
+    def MORNING_PROMPT_ADDITION(self) -> str:
+        """The morning protocol, loaded once at construction."""
+        return self._morning_addition
+
+    @staticmethod
+    def _load_base_prompt() -> str:
+        """Read the base system prompt plus agent context enhancement."""
         base_prompt = get_coach_system_prompt()
-        # Add agent context enhancement
         try:
             with open("src/agents/prompts/coach_agent_context.md", "r") as f:
                 context_enhancement = f.read()
@@ -45,11 +154,6 @@ class EnhancedDiaryCoach(BaseAgent):
         except Exception:
             return base_prompt
 
-    @property
-    def MORNING_PROMPT_ADDITION(self) -> str:
-        """Load the morning protocol from the master prompt file."""
-        return get_coach_morning_protocol()
-
     def __init__(self, llm_service: AnthropicService):
         """Initialize the enhanced diary coach.
 
@@ -61,8 +165,15 @@ class EnhancedDiaryCoach(BaseAgent):
             capabilities=[AgentCapability.CONVERSATION]
         )
         self.llm_service = llm_service
+        # Cache prompts once; property access is then attribute lookup
+        # and the morning variant needs no per-turn concatenation
+        self._base_prompt = self._load_base_prompt()
+        self._morning_addition = get_coach_morning_protocol()
+        self._morning_prompt = (
+            self._base_prompt + "\n\n" + self._morning_addition
+        )
         self.conversation_state = "general"  # general, morning
-        self.morning_challenge: Optional[str] = None
+        self.morning_challenge = None
         self.morning_value: Optional[str] = None
         self.message_history: List[Dict[str, str]] = []
         self.crux_identified: Optional[str] = None
@@ -72,66 +183,93 @@ class EnhancedDiaryCoach(BaseAgent):
         self.protocol_tracker = MorningProtocolTracker(self.MORNING_PROMPT_ADDITION)
         self._next_nudge = None  # Store nudge for next generation
 
-        # Agent collaboration tracking
-        self.agent_call_history: List[Dict[str, Any]] = []
+        # Agent collaboration tracking (bounded; timestamps are
+        # time.monotonic() seconds for cheap age checks)
+        self.agent_call_history: deque = deque(maxlen=100)
         self.max_agent_calls_per_turn = 2  # Prevent over-calling
-        self.recent_agent_calls: Set[str] = set()  # Track recent calls
+        # Per-agent cooldown: turn index of each agent's last call,
+        # checked against _turn_counter so each agent re-fires on its
+        # own schedule instead of an all-or-nothing periodic reset
+        self._agent_cooldown: Dict[str, int] = {}
+        self._agent_cooldown_turns = 3
+        self._turn_counter = 0
 
         # Check if multi-agent mode is enabled
-        self.multi_agent_enabled = (
-            os.getenv("DISABLE_MULTI_AGENT", "false").lower() != "true"
-        )
+        self.multi_agent_enabled = multi_agent_enabled()
 
         # Stage management
         self.current_stage = 1  # Start in Stage 1 (exploration)
         self.problem_identified = False
 
+        # Resolved collaborator agents, memoized on first successful
+        # registry lookup
+        self._agents_cache: Dict[str, BaseAgent] = {}
+
     async def initialize(self) -> None:
         """Initialize the coach agent."""
         self.is_initialized = True
         logger.info("Enhanced coach agent initialized with multi-agent support")
 
+    @property
+    def morning_challenge(self) -> Optional[str]:
+        """Today's stated challenge, if one has been captured."""
+        return self._morning_challenge
+
+    @morning_challenge.setter
+    def morning_challenge(self, value: Optional[str]) -> None:
+        self._morning_challenge = value
+        # Lowered copy maintained on assignment so the per-turn
+        # complexity check never re-lowers (or str()-wraps None)
+        self._morning_challenge_lower = value.lower() if value else None
+
+    def _resolve_agent(self, name: str) -> Optional[BaseAgent]:
+        """Resolve an agent by name, memoizing successful lookups.
+
+        Misses are not cached, so agents registered after this coach
+        was constructed are still picked up on their first use.
+        """
+        agent = self._agents_cache.get(name)
+        if agent is None:
+            agent = agent_registry.get_agent(name)
+            if agent is not None:
+                self._agents_cache[name] = agent
+        return agent
+
     def _is_morning_context(self, message_content: str) -> bool:
         """Check if user is in morning context based on their message."""
-        morning_greetings = [
-            "good morning", "morning", "gm", "g'morning",
-            "goodmorning", "mornin"
-        ]
-        content_lower = message_content.lower().strip()
-        return any(greeting in content_lower for greeting in morning_greetings)
+        return _MORNING_RE.search(message_content) is not None
 
-    def _get_system_prompt(self) -> str:
-        """Get the appropriate system prompt based on conversation context."""
-        base_prompt = self.SYSTEM_PROMPT
+    def _get_static_prompt(self) -> str:
+        """Get the stable system prompt prefix for this turn.
 
+        Contains only content that is byte-stable across turns (base
+        prompt, morning protocol) so it can carry an Anthropic
+        prompt-cache breakpoint; per-turn additions such as nudges and
+        agent context belong in the uncached trailing block.
+        """
         # Check if we're in morning conversation mode
         if self.conversation_state == "morning":
-            morning_prompt = base_prompt + "\n\n" + self.MORNING_PROMPT_ADDITION
-            # Add nudge if we have one
-            if self._next_nudge:
-                logger.info(f"Adding nudge to prompt: {self._next_nudge[:50]}...")
-                morning_prompt += self._next_nudge
-                self._next_nudge = None  # Use once then clear
-            return morning_prompt
-
-        # Also check recent messages for morning context
-        elif self.message_history:
-            # Check last few user messages for morning greeting
-            recent_user_messages = [
-                msg for msg in self.message_history[-6:]
-                if msg.get("role") == "user"
-            ]
-            if any(self._is_morning_context(msg["content"])
-                   for msg in recent_user_messages):
-                return base_prompt + "\n\n" + self.MORNING_PROMPT_ADDITION
-
-        return base_prompt
-
-    async def _should_call_agent(
+            return self._morning_prompt
+
+        # Fallback scan of recent user messages; conversation_state is
+        # already sticky once process_message sees a greeting, so this
+        # mainly covers externally seeded histories. Newest-first with
+        # early exit - no intermediate list
+        for msg in reversed(self.message_history[-6:]):
+            if (msg.get("role") == "user"
+                    and self._is_morning_context(msg["content"])):
+                return self._morning_prompt
+
+        return self._base_prompt
+
+    def _should_call_agent(
         self, agent_type: str, message_content: str
     ) -> bool:
         """Determine if an agent should be called based on message content.
 
+        Plain sync method: this is a pure string scan, so routing it
+        through the event loop would only add scheduling overhead.
+
         Args:
             agent_type: Type of agent (memory, personal_content, mcp)
             message_content: User's message content
@@ -139,36 +277,20 @@ class EnhancedDiaryCoach(BaseAgent):
         Returns:
             Boolean indicating if agent should be called
         """
-        content_lower = message_content.lower()
-
-        # Check if we've called this agent recently
-        if agent_type in self.recent_agent_calls:
+        # Check if this agent is still within its cooldown window
+        last_called = self._agent_cooldown.get(agent_type)
+        if (last_called is not None and
+                self._turn_counter - last_called < self._agent_cooldown_turns):
             logger.debug(f"Skipping {agent_type} - called recently")
             return False
 
-        # Agent-specific triggers
-        if agent_type == "memory":
-            triggers = [
-                "remember when", "last time", "previously", "before",
-                "past conversation", "we discussed", "you mentioned"
-            ]
-            should_call = any(trigger in content_lower for trigger in triggers)
-
-        elif agent_type == "personal_content":
-            triggers = [
-                "belief", "value", "core", "philosophy", "principle",
-                "my approach", "I believe", "important to me"
-            ]
-            should_call = any(trigger in content_lower for trigger in triggers)
-
-        elif agent_type == "mcp":
-            triggers = [
-                "task", "todo", "priorit", "should i work", "what to do",
-                "today", "deadline", "project", "focus on", "tackle"
-            ]
-            should_call = any(trigger in content_lower for trigger in triggers)
-        else:
-            should_call = False
+        # Agent-specific triggers: one precompiled scan per category,
+        # case handled by the pattern so no lowered copy is needed
+        pattern = _AGENT_TRIGGER_RES.get(agent_type)
+        should_call = (
+            pattern is not None
+            and pattern.search(message_content) is not None
+        )
 
         logger.debug(
             f"Should call {agent_type}? {should_call} "
@@ -195,7 +317,7 @@ class EnhancedDiaryCoach(BaseAgent):
             return None
 
         try:
-            agent = agent_registry.get_agent(agent_name)
+            agent = self._resolve_agent(agent_name)
             if not agent:
                 logger.warning(f"Agent {agent_name} not found in registry")
                 return None
@@ -211,14 +333,14 @@ class EnhancedDiaryCoach(BaseAgent):
 
             # Track the call
             self.agent_call_history.append({
-                "timestamp": datetime.now(),
+                "timestamp": time.monotonic(),
                 "agent": agent_name,
                 "query": query,
                 "success": response.error is None
             })
 
-            # Mark as recently called
-            self.recent_agent_calls.add(agent_name)
+            # Start this agent's cooldown window
+            self._agent_cooldown[agent_name] = self._turn_counter
 
             return response
 
@@ -226,11 +348,14 @@ class EnhancedDiaryCoach(BaseAgent):
             logger.error(f"Error calling agent {agent_name}: {e}")
             return None
 
-    def _should_check_orchestration(self, message: UserMessage) -> bool:
+    def _should_check_orchestration(
+        self, message: UserMessage, content_lower: str
+    ) -> bool:
         """Determine if we should check for orchestration based on complexity.
 
         Args:
             message: The user message to analyze
+            content_lower: message.content lowered once by the caller
 
         Returns:
             True if message indicates complex needs requiring orchestration
@@ -244,7 +369,6 @@ class EnhancedDiaryCoach(BaseAgent):
             return False
 
         # Check for complexity indicators in message
-        message_lower = message.content.lower()
         complexity_indicators = [
             "help me figure out",
             "i'm struggling with",
@@ -260,11 +384,12 @@ class EnhancedDiaryCoach(BaseAgent):
         ]
 
         # If user explicitly asks for deeper analysis
-        if any(indicator in message_lower for indicator in complexity_indicators):
+        if any(indicator in content_lower for indicator in complexity_indicators):
             return True
 
         # If coach explicitly identified a complex problem
-        if self.problem_identified and "complex" in str(self.morning_challenge).lower():
+        if (self.problem_identified and self._morning_challenge_lower and
+                "complex" in self._morning_challenge_lower):
             return True
 
         return False
@@ -279,17 +404,13 @@ class EnhancedDiaryCoach(BaseAgent):
             return False
 
         # Check if orchestrator is available
-        orchestrator = agent_registry.get_agent("orchestrator")
+        orchestrator = self._resolve_agent("orchestrator")
         if not orchestrator:
             return False
 
-        # Build conversation history for orchestrator
-        conversation_history = []
-        for i in range(0, len(self.message_history), 2):
-            if i < len(self.message_history):
-                conversation_history.append(self.message_history[i])
-            if i + 1 < len(self.message_history):
-                conversation_history.append(self.message_history[i + 1])
+        # History is already ordered user/assistant pairs; a defensive
+        # copy is all the orchestrator needs
+        conversation_history = list(self.message_history)
 
         # Ask orchestrator about stage transition
         request = AgentRequest(
@@ -324,7 +445,7 @@ class EnhancedDiaryCoach(BaseAgent):
         Returns:
             Aggregated context from all agents
         """
-        orchestrator = agent_registry.get_agent("orchestrator")
+        orchestrator = self._resolve_agent("orchestrator")
         if not orchestrator:
             logger.warning("Orchestrator not available for Stage 2")
             return {}
@@ -369,98 +490,112 @@ class EnhancedDiaryCoach(BaseAgent):
 
     @traceable(name="gather_agent_context")
     async def _gather_agent_context(
-        self, message: UserMessage
+        self, message: UserMessage, now: datetime, content_lower: str
     ) -> Dict[str, Any]:
         """Gather context from relevant agents based on message.
 
         Args:
             message: User message to analyze
+            now: Timestamp captured once at the start of the turn
+            content_lower: message.content lowered once by the caller
 
         Returns:
             Dictionary of agent contexts
         """
         agent_context = {}
-        calls_made = 0
 
         # Check if we should transition to Stage 2 - only if complexity detected
-        if self.current_stage == 1 and self._should_check_orchestration(message):
+        if (self.current_stage == 1 and
+                self._should_check_orchestration(message, content_lower)):
             await self._check_stage_transition()
 
         # Stage 2: Use orchestrator for coordination
         if self.current_stage == 2:
             return await self._gather_stage2_context(message)
 
+        # Fast path for general chat: no trigger from any category
+        # means none of the per-agent checks can fire
+        if not _ANY_TRIGGER_RE.search(message.content):
+            return agent_context
+
         # Stage 1: Direct agent calls based on triggers
         agents_to_call = []
 
-        if await self._should_call_agent("memory", message.content):
+        if self._should_call_agent("memory", message.content):
             agents_to_call.append(("memory", "memory"))
 
-        if await self._should_call_agent("personal_content", message.content):
+        if self._should_call_agent("personal_content", message.content):
             agents_to_call.append(("personal_content", "personal_content"))
 
-        if await self._should_call_agent("mcp", message.content):
+        if self._should_call_agent("mcp", message.content):
             agents_to_call.append(("mcp", "mcp"))
 
         # Limit calls per turn
         agents_to_call = agents_to_call[:self.max_agent_calls_per_turn]
 
-        # Make the calls
-        for agent_name, context_key in agents_to_call:
-            if calls_made >= self.max_agent_calls_per_turn:
-                break
+        if not agents_to_call:
+            return agent_context
 
-            # Prepare query with date context for MCP agent
+        # Prepare queries (with date context for MCP agent)
+        call_specs = []
+        for agent_name, context_key in agents_to_call:
             query = message.content
             if agent_name == "mcp":
-                content_lower = message.content.lower()
                 # Check if user is asking about today/priorities
                 keywords = ["today", "priorit", "should i work", "focus"]
                 if any(word in content_lower for word in keywords):
                     # Enhance query to explicitly ask for today's tasks
                     query = (
                         f"{message.content} (focus on tasks due today)")
+            call_specs.append((agent_name, context_key, query))
+
+        # Identical for every agent this turn, so build it once and
+        # share the reference instead of rebuilding per request
+        shared_context = {
+            "conversation_id": message.conversation_id,
+            "messages": self.message_history[-5:],  # Last 5 messages
+            # Add today's date
+            "current_date": now.date().isoformat()
+        }
 
-            response = await self._call_agent(
-                agent_name,
-                query,
-                {
-                    "conversation_id": message.conversation_id,
-                    "messages": self.message_history[-5:],  # Last 5 messages
-                    # Add today's date
-                    "current_date": datetime.now().date().isoformat()
-                }
-            )
+        # Make the calls concurrently - each is a remote agent/LLM/MCP
+        # roundtrip, so overlapping them costs max(latencies) not the sum
+        responses = await asyncio.gather(
+            *(
+                self._call_agent(agent_name, query, shared_context)
+                for agent_name, _, query in call_specs
+            ),
+            return_exceptions=True
+        )
 
-            if response and not response.error:
+        for (_, context_key, _), response in zip(call_specs, responses):
+            # _call_agent returns None on failure; gather may also hand
+            # back an exception instance, so keep only real responses
+            if isinstance(response, AgentResponse) and not response.error:
                 agent_context[context_key] = {
                     "content": response.content,
                     "metadata": response.metadata
                 }
-                calls_made += 1
 
         return agent_context
 
-    def _should_consult_reporter_for_phase2(self, message: UserMessage) -> bool:
+    def _should_consult_reporter_for_phase2(
+        self, message: UserMessage, content_lower: str
+    ) -> bool:
         """Check if we should consult reporter for phase 2 questions.
 
         Args:
             message: User message
+            content_lower: message.content lowered once by the caller
 
         Returns:
             True if we should consult reporter for phase 2 insights
         """
-        # Check if user accepted deeper questions
-        message_lower = message.content.lower()
-        acceptance_phrases = [
-            "yes", "sure", "ok", "okay", "ready", "let's do it",
-            "i'm ready", "sounds good", "go ahead", "deeper questions"
-        ]
-
-        # Check if we're in morning protocol and have identified a crux
+        # Check if we're in morning protocol, have identified a crux,
+        # and the user accepted deeper questions
         if (self.conversation_state == "morning" and
-            self.crux_identified and
-            any(phrase in message_lower for phrase in acceptance_phrases)):
+                self.crux_identified and
+                _ACCEPT_RE.search(content_lower)):
             # Look for context suggesting phase 2
             recent_assistant = self.message_history[-1] if self.message_history else None
             if recent_assistant and recent_assistant.get("role") == "assistant":
@@ -481,7 +616,7 @@ class EnhancedDiaryCoach(BaseAgent):
         """
         try:
             # Get reporter from registry
-            reporter = agent_registry.get_agent("reporter")
+            reporter = self._resolve_agent("reporter")
             if not reporter:
                 logger.warning("Reporter agent not available for phase 2")
                 return ""
@@ -518,6 +653,23 @@ class EnhancedDiaryCoach(BaseAgent):
             logger.error(f"Error getting phase 2 insights: {e}")
             return ""
 
+    def _response_cache_context(self) -> str:
+        """Fingerprint of the non-query inputs that shape an LLM reply.
+
+        A cached coach response is only reusable when the system
+        prompt, prior history, and sampling temperature all match, so
+        the cache is keyed by a digest of those alongside the query.
+        """
+        payload = json.dumps(
+            {
+                "system": self._get_static_prompt(),
+                "messages": self.message_history,
+                "temperature": 0.7,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
     def _enhance_prompt_with_context(
         self, base_prompt: str, agent_context: Dict[str, Any]
     ) -> str:
@@ -530,42 +682,49 @@ class EnhancedDiaryCoach(BaseAgent):
         Returns:
             Enhanced prompt
         """
+        return base_prompt + self._render_context_sections(agent_context)
+
+    def _render_context_sections(
+        self, agent_context: Dict[str, Any]
+    ) -> str:
+        """Render agent context as a prompt suffix, or "" when empty.
+
+        Kept separate from the base prompt so the suffix can travel in
+        an uncached system block after the stable, cached prefix.
+        """
         if not agent_context:
-            return base_prompt
+            return ""
 
-        context_sections = []
+        # Single join over flat parts: one output allocation instead
+        # of an intermediate string per section
+        parts = []
 
         if "memory" in agent_context:
-            context_sections.append(
-                f"RELEVANT PAST CONVERSATIONS:\n{agent_context['memory']['content']}"
+            parts.extend(
+                ("\n\nRELEVANT PAST CONVERSATIONS:\n",
+                 agent_context["memory"]["content"])
             )
 
         if "personal_content" in agent_context:
-            context_sections.append(
-                f"PERSONAL CONTEXT:\n{agent_context['personal_content']['content']}"
+            parts.extend(
+                ("\n\nPERSONAL CONTEXT:\n",
+                 agent_context["personal_content"]["content"])
             )
 
         if "mcp" in agent_context:
-            context_sections.append(
-                f"CURRENT TASKS:\n{agent_context['mcp']['content']}"
+            parts.extend(
+                ("\n\nCURRENT TASKS:\n",
+                 agent_context["mcp"]["content"])
             )
 
-        if context_sections:
-            context_block = "\n\n".join(context_sections)
-            return (
-                f"{base_prompt}\n\n"
-                f"## IMPORTANT: Current Context from Agents\n\n"
-                f"{context_block}\n\n"
-                f"## Context Usage Instructions:\n"
-                f"- When user asks 'what should I work on' or about tasks: "
-                f"Reference the ACTUAL tasks above, not examples\n"
-                f"- When user asks about beliefs/values: Use the ACTUAL personal "
-                f"context above\n"
-                f"- Integrate this real data naturally into your coaching questions\n"
-                f"- NEVER make up example tasks or beliefs when real data is provided"
-            )
+        if not parts:
+            return ""
 
-        return base_prompt
+        return "".join(
+            ["\n\n## IMPORTANT: Current Context from Agents"]
+            + parts
+            + [_CONTEXT_USAGE_INSTRUCTIONS]
+        )
 
     @traceable(name="enhanced_coach_process_message")
     @profile_async("coach_process_message", send_to_langsmith=True)
@@ -581,15 +740,28 @@ class EnhancedDiaryCoach(BaseAgent):
         logger.info(
             f"EnhancedDiaryCoach.process_message: {message.content}")
 
+        self._turn_counter += 1
+        # One wall-clock read and one lowering per turn, reused below
+        now = datetime.now()
+        content_lower = message.content.lower()
+
         # Try to get cached response first (only for simple queries)
         cache = get_cache()
         cached_response = None
 
-        # Only use cache for non-morning, non-complex queries
+        # Compute the context fingerprint before the user message is
+        # appended, so the get and set sides key on the same history
+        cache_context = None
         if (self.conversation_state != "morning" and
+                len(self.message_history) < 8):
+            cache_context = self._response_cache_context()
+
+        # Only use cache for non-morning, non-complex queries
+        if (cache_context is not None and
             len(self.message_history) < 6 and
-            not self._should_check_orchestration(message)):
-            cached_response = await cache.get_coach_response(message.content)
+            not self._should_check_orchestration(message, content_lower)):
+            cached_response = await cache.get_coach_response(
+                message.content, cache_context)
             if cached_response:
                 logger.info("Cache hit for coach response")
                 # Still update message history
@@ -607,6 +779,80 @@ class EnhancedDiaryCoach(BaseAgent):
                     metadata={"cached": True}
                 )
 
+        agent_context, system_prompt = await self._prepare_turn(
+            message, now, content_lower)
+
+        # Generate response
+        response_content = await self.llm_service.generate_response(
+            messages=self.message_history,
+            system_prompt=system_prompt,
+            max_tokens=200,
+            temperature=0.7
+        )
+
+        # Cache the response for simple queries
+        if (cache_context is not None and
+            self.conversation_state != "morning" and
+            len(self.message_history) < 8 and
+            not agent_context):  # Don't cache if agents were involved
+            await cache.set_coach_response(
+                message.content, response_content, cache_context)
+            logger.debug(f"Cached response for: {message.content[:50]}...")
+
+        self._finish_turn(message, response_content, agent_context)
+
+        return LegacyAgentResponse(
+            agent_name=self.name,
+            content=response_content,
+            response_to=message.message_id,
+            timestamp=now,
+            conversation_id=message.conversation_id
+        )
+
+    async def process_message_stream(
+        self, message: UserMessage
+    ) -> AsyncIterator[str]:
+        """Stream a coaching response, yielding text deltas as they
+        arrive while accumulating the full reply for history.
+
+        Runs the same pre/post turn work as process_message but skips
+        the response cache: the point of streaming is time to first
+        token, and cached replies already return in one piece.
+        """
+        logger.info(
+            f"EnhancedDiaryCoach.process_message_stream: {message.content}")
+
+        self._turn_counter += 1
+        now = datetime.now()
+        content_lower = message.content.lower()
+
+        agent_context, system_prompt = await self._prepare_turn(
+            message, now, content_lower)
+
+        parts: List[str] = []
+        async for delta in self.llm_service.generate_response_stream(
+            messages=self.message_history,
+            system_prompt=system_prompt,
+            max_tokens=200,
+            temperature=0.7
+        ):
+            parts.append(delta)
+            yield delta
+
+        self._finish_turn(message, "".join(parts), agent_context)
+
+    async def _prepare_turn(
+        self, message: UserMessage, now: datetime, content_lower: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Run the pre-LLM work for one turn.
+
+        Updates conversation state and history, gathers phase-2 and
+        agent context, and assembles the system prompt blocks. Shared
+        by the blocking and streaming response paths.
+
+        Returns:
+            (agent_context, system_prompt) tuple
+        """
         # Check and update conversation state BEFORE generating response
         if (self._is_morning_context(message.content) and
                 self.conversation_state == "general"):
@@ -620,28 +866,53 @@ class EnhancedDiaryCoach(BaseAgent):
         })
 
         # Check if we need phase 2 reporter insights
-        if self._should_consult_reporter_for_phase2(message):
+        if self._should_consult_reporter_for_phase2(message, content_lower):
             reporter_insights = await self._get_reporter_phase2_insights(message)
             logger.info(f"Phase 2 reporter insights: {reporter_insights[:100]}...")
             # Store insights for prompt enhancement
             self._phase2_insights = reporter_insights
 
         # Gather context from agents if in Stage 1
-        agent_context = await self._gather_agent_context(message)
+        agent_context = await self._gather_agent_context(
+            message, now, content_lower)
 
-        # Get base system prompt (includes nudge if available)
-        base_prompt = self._get_system_prompt()
+        # Static prefix (base prompt + morning protocol) is byte-stable
+        # across turns, so it carries the prompt-cache breakpoint
+        static_prompt = self._get_static_prompt()
 
-        # Enhance prompt with agent context
-        system_prompt = self._enhance_prompt_with_context(base_prompt, agent_context)
+        # Everything per-turn goes in an uncached trailing block so it
+        # never invalidates the cached prefix
+        dynamic_parts = []
+        if self.conversation_state == "morning" and self._next_nudge:
+            logger.info(f"Adding nudge to prompt: {self._next_nudge[:50]}...")
+            dynamic_parts.append(self._next_nudge)
+            self._next_nudge = None  # Use once then clear
+
+        context_section = self._render_context_sections(agent_context)
+        if context_section:
+            dynamic_parts.append(context_section)
 
         # Add phase 2 insights if available
         if hasattr(self, '_phase2_insights') and self._phase2_insights:
-            system_prompt += f"\n\n## PHASE 2 COACHING INSIGHTS\n{self._phase2_insights}\n"
-            system_prompt += "\nUse these insights to ask deeper, more targeted questions about the crux."
+            dynamic_parts.append(
+                f"\n\n## PHASE 2 COACHING INSIGHTS\n{self._phase2_insights}\n"
+                "\nUse these insights to ask deeper, more targeted "
+                "questions about the crux."
+            )
             # Clear insights after use
             self._phase2_insights = None
 
+        system_prompt: List[Dict[str, Any]] = [{
+            "type": "text",
+            "text": static_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+        if dynamic_parts:
+            system_prompt.append({
+                "type": "text",
+                "text": "".join(dynamic_parts)
+            })
+
         # Debug logging
         logger.info(f"Enhanced coach: agents_called={list(agent_context.keys())}")
         logger.info(f"Conversation state: {self.conversation_state}")
@@ -650,32 +921,34 @@ class EnhancedDiaryCoach(BaseAgent):
             for agent, data in agent_context.items():
                 logger.info(f"  {agent}: {data['content'][:100]}...")
 
-        # Generate response
-        response_content = await self.llm_service.generate_response(
-            messages=self.message_history,
-            system_prompt=system_prompt,
-            max_tokens=200,
-            temperature=0.7
-        )
+        return agent_context, system_prompt
 
-        # Cache the response for simple queries
-        if (self.conversation_state != "morning" and
-            len(self.message_history) < 8 and
-            not agent_context):  # Don't cache if agents were involved
-            await cache.set_coach_response(message.content, response_content)
-            logger.debug(f"Cached response for: {message.content[:50]}...")
+    def _finish_turn(
+        self,
+        message: UserMessage,
+        response_content: str,
+        agent_context: Dict[str, Any]
+    ) -> None:
+        """Run the post-LLM bookkeeping for one turn.
 
-        # Update message history
+        Appends the reply to history, trims to the retention cap,
+        tracks crux identification, prepares morning nudges, and
+        records per-turn metadata.
+        """
         self.message_history.append({
             "role": "assistant",
             "content": response_content
         })
 
-        # Track crux identification
-        if "crux" in response_content.lower() and "identified" in response_content.lower():
-            # Extract crux from response
-            import re
-            crux_match = re.search(r'crux[^:]*:([^.!?]+)', response_content, re.IGNORECASE)
+        # Drop the oldest turns once past the retention cap
+        if len(self.message_history) > _MAX_HISTORY_MESSAGES:
+            del self.message_history[:-_MAX_HISTORY_MESSAGES]
+
+        # Track crux identification (cheap substring prefilter first so
+        # the regex only runs on responses that can actually match)
+        response_lower = response_content.lower()
+        if "crux" in response_lower and "identified" in response_lower:
+            crux_match = _CRUX_RE.search(response_content)
             if crux_match:
                 self.crux_identified = crux_match.group(1).strip()
                 logger.info(f"Crux identified: {self.crux_identified}")
@@ -693,57 +966,49 @@ class EnhancedDiaryCoach(BaseAgent):
                 logger.info(f"Morning protocol nudge prepared: {nudge[:50]}...")
                 logger.info(f"Protocol state: {self.protocol_tracker.current_state}")
 
-        # Clear recent calls periodically (every 3 turns)
-        # 3 user + 3 assistant messages
-        if len(self.message_history) % 6 == 0:
-            self.recent_agent_calls.clear()
-
         # Store metadata for testing
-        self._last_response_metadata = {
-            "conversation_state": self.conversation_state,
-            "morning_challenge": self.morning_challenge,
-            "morning_value": self.morning_value,
-            "agents_called": list(agent_context.keys()),
-            "agent_calls_made": len(agent_context),
-            "current_stage": self.current_stage,
-            "problem_identified": self.problem_identified
-        }
-
-        return LegacyAgentResponse(
-            agent_name=self.name,
-            content=response_content,
-            response_to=message.message_id,
-            timestamp=datetime.now(),
-            conversation_id=message.conversation_id
+        self._last_response_metadata = CoachResponseMetadata(
+            conversation_state=self.conversation_state,
+            morning_challenge=self.morning_challenge,
+            morning_value=self.morning_value,
+            agents_called=list(agent_context.keys()),
+            agent_calls_made=len(agent_context),
+            current_stage=self.current_stage,
+            problem_identified=self.problem_identified
         )
 
     async def handle_request(self, request: AgentRequest) -> AgentResponse:
         """Handle a request from another agent or the orchestrator."""
         try:
-            # Convert to UserMessage
+            now = datetime.now()
+            # Convert to UserMessage; defaults are only materialized
+            # when the context doesn't supply a value
+            context_timestamp = request.context.get("timestamp")
             user_message = UserMessage(
                 content=request.query,
                 user_id=request.context.get("user_id", "michael"),
                 conversation_id=request.context.get("conversation_id", "default"),
-                message_id=request.context.get(
-                    "message_id", str(datetime.now().timestamp())
+                message_id=(
+                    request.context.get("message_id")
+                    or str(now.timestamp())
                 ),
-                timestamp=datetime.fromisoformat(
-                    request.context.get("timestamp", datetime.now().isoformat())
+                timestamp=(
+                    datetime.fromisoformat(context_timestamp)
+                    if context_timestamp else now
                 )
             )
 
             # Process through enhanced method
             legacy_response = await self.process_message(user_message)
 
-            # Convert back with metadata
-            metadata = getattr(self, '_last_response_metadata', {})
+            # Convert back with metadata (dict only at this edge)
+            metadata = getattr(self, '_last_response_metadata', None)
             return AgentResponse(
                 agent_name=self.name,
                 content=legacy_response.content,
-                metadata=metadata,
+                metadata=asdict(metadata) if metadata else {},
                 request_id=request.request_id,
-                timestamp=datetime.now()
+                timestamp=now
             )
         except Exception as e:
             logger.error(f"Error in enhanced coach: {e}")
@@ -1,19 +1,54 @@
 """Evaluator Agent for assessing coaching quality with 5 criteria."""
 
+import asyncio
+import hashlib
 import logging
 import json
-import re
 import os
+import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from uuid import uuid4
 
 from src.agents.base import BaseAgent, AgentRequest, AgentResponse, AgentCapability
 from src.services.llm_service import AnthropicService
 from src.config.models import ModelProvider, get_model_for_tier
 from src.agents.prompts import PromptLoader
 
+try:
+    from langsmith import Client as LangSmithClient
+    LANGSMITH_AVAILABLE = True
+except ImportError:
+    LANGSMITH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# On-disk cache for criterion results, opt-in via EVAL_CACHE=1.
+# Useful when re-evaluating the same conversation during prompt
+# tuning; never enabled in production so scores stay fresh
+_DEFAULT_EVAL_CACHE_DIR = ".eval_cache"
+
+# Markdown code fence wrapping a JSON object, with or without the
+# json language tag
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Decoder for extracting JSON embedded in prose; strict=False
+# tolerates literal newlines inside strings, which LLM output
+# sometimes contains
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+# Shared LangSmith client; constructing one per evaluation rebuilds
+# the HTTP session and re-reads env config every time
+_langsmith_client: Optional["LangSmithClient"] = None
+
+
+def _get_langsmith_client() -> "LangSmithClient":
+    """Return the shared LangSmith client, creating it on first use."""
+    global _langsmith_client
+    if _langsmith_client is None:
+        _langsmith_client = LangSmithClient()
+    return _langsmith_client
+
 
 class EvaluatorAgent(BaseAgent):
     """Agent that evaluates coaching conversations using 5 key criteria."""
@@ -24,29 +59,74 @@ class EvaluatorAgent(BaseAgent):
             "name": "Problem Definition",
             "description": "Define biggest problem and understand why it matters",
             "binary": True,
+            "instructions": """Evaluate if the session helped client:
+1. Identify and clearly define their biggest/most important problem
+2. Understand why this specific problem matters to them
+3. Articulate the significance and impact of solving this problem
+
+Look for explicit problem identification and exploration of its importance.""",
         },
         "B": {
             "name": "Crux Recognition",
             "description": "Recognize the key constraint to address ('the crux')",
             "binary": True,
+            "instructions": """Evaluate if the session helped client:
+1. Identify the key constraint or bottleneck (the 'crux') preventing progress
+2. Distinguish between symptoms and root causes
+3. Recognize what must be addressed first to unlock progress
+
+Look for deep analysis that goes beyond surface-level issues.""",
         },
         "C": {
             "name": "Today Accomplishment",
             "description": "Define what to accomplish today to address crux",
             "binary": True,
+            "instructions": """Evaluate if the session helped client:
+1. Define a specific, concrete action to take TODAY
+2. Connect this action directly to addressing the identified crux
+3. Make the action achievable and measurable
+
+Look for clear next steps, not vague intentions.""",
         },
         "D": {
             "name": "Multiple Paths",
             "description": "Define multiple viable and different paths forward",
             "binary": False,  # Graduated score 0-1
+            "instructions": """Evaluate how well the session:
+1. Explored multiple distinct approaches to address the crux
+2. Presented genuinely different paths (not variations of the same idea)
+3. Considered trade-offs and implications of each path
+
+Score from 0.0 (single path) to 1.0 (multiple creative options).""",
         },
         "E": {
             "name": "Core Beliefs",
             "description": "Define which 'core beliefs'/'tenets' to focus on",
             "binary": False,  # Graduated score 0-1
+            "instructions": """Evaluate how well the session:
+1. Connected solutions to the client's core beliefs and values
+2. Referenced specific principles or tenets to guide action
+3. Aligned recommendations with what matters most to the client
+
+Score from 0.0 (no connection) to 1.0 (deep value alignment).""",
         },
     }
 
+    # Weight binary criteria more heavily (they're foundational)
+    _WEIGHTS: Dict[str, float] = {
+        "A": 0.25,  # Problem Definition
+        "B": 0.25,  # Crux Recognition
+        "C": 0.25,  # Today Accomplishment
+        "D": 0.125,  # Multiple Paths
+        "E": 0.125,  # Core Beliefs
+    }
+
+    # Generation budgets: criterion replies are a small JSON object,
+    # so a tight cap shortens worst-case generation time; the summary
+    # needs more room
+    _CRITERION_MAX_TOKENS = 200
+    _SUMMARY_MAX_TOKENS = 500
+
     def __init__(self, llm_service: Optional[AnthropicService] = None):
         """Initialize Evaluator Agent.
 
@@ -69,17 +149,29 @@ class EvaluatorAgent(BaseAgent):
 
         # Load prompts
         self.prompt_loader = PromptLoader()
+        self._system_prompt: Optional[str] = None
+
+        # In-flight LangSmith submissions; referenced so the tasks
+        # aren't garbage collected before they finish
+        self._pending_telemetry: set[asyncio.Task] = set()
 
     @property
     def system_prompt(self) -> str:
-        """Load system prompt from markdown file."""
-        try:
-            # Load Evaluator system prompt
-            return self.prompt_loader.load_prompt("evaluator_agent_prompt")
-        except Exception as e:
-            logger.error(f"Error loading Evaluator prompt: {e}")
-            # Fallback prompt
-            return """You are a Coach Quality Evaluator.
+        """Load system prompt from markdown file (cached after first load).
+
+        The prompt is accessed once per LLM call (6+ times per
+        evaluation), so the file load happens only on first access.
+        """
+        if self._system_prompt is None:
+            try:
+                # Load Evaluator system prompt
+                self._system_prompt = self.prompt_loader.load_prompt(
+                    "evaluator_agent_prompt"
+                )
+            except Exception as e:
+                logger.error(f"Error loading Evaluator prompt: {e}")
+                # Fallback prompt
+                self._system_prompt = """You are a Coach Quality Evaluator.
 
 Evaluate coaching effectiveness using 5 specific criteria:
 - A: Problem Definition (binary 0 or 1)
@@ -89,12 +181,24 @@ Evaluate coaching effectiveness using 5 specific criteria:
 - E: Core Beliefs (graduated 0.0-1.0)
 
 Be fair but rigorous in your assessment."""
+        return self._system_prompt
+
+    def invalidate_prompt_cache(self) -> None:
+        """Force the system prompt to be reloaded on next access."""
+        self._system_prompt = None
 
     async def initialize(self) -> None:
         """Initialize the evaluator agent."""
         self.is_initialized = True
         logger.info("Evaluator agent initialized")
 
+    async def flush_telemetry(self) -> None:
+        """Wait for any in-flight LangSmith submissions to finish."""
+        if self._pending_telemetry:
+            await asyncio.gather(
+                *self._pending_telemetry, return_exceptions=True
+            )
+
     async def handle_request(self, request: AgentRequest) -> AgentResponse:
         """Evaluate coaching conversation and Deep Thoughts report.
 
@@ -109,45 +213,65 @@ Be fair but rigorous in your assessment."""
             conversation = request.context.get("conversation", [])
             deep_thoughts = request.context.get("deep_thoughts", "")
 
-            # Evaluate each criterion
-            evaluations = {}
-            for criterion_id, criterion_info in self.CRITERIA.items():
-                score, reasoning = await self._evaluate_criterion(
-                    criterion_id, criterion_info, conversation, deep_thoughts
-                )
-                evaluations[criterion_id] = {
-                    "name": criterion_info["name"],
-                    "score": score,
-                    "reasoning": reasoning,
-                }
-
-            # Calculate overall assessment
-            overall_score = self._calculate_overall_score(evaluations)
+            # Format the transcript once; every criterion prompt and
+            # the summary prompt embed the same text
+            conv_text = self._format_conversation(conversation)
 
-            # Generate conversation summary
             summary_prompt = (
                 f"Generate a conversation summary following the Conversation "
                 f"Summary Guidelines from your system prompt.\n\n"
-                f"Conversation:\n{self._format_conversation(conversation)}\n\n"
+                f"Conversation:\n{conv_text}\n\n"
                 f"Deep Thoughts Report:\n{deep_thoughts}"
             )
 
-            conversation_summary = await self.llm_service.generate_response(
-                messages=[{"role": "user", "content": summary_prompt}],
-                system_prompt=self.system_prompt,
-                max_tokens=500,
-                temperature=0.5
+            # The five criterion evaluations and the summary are
+            # independent LLM roundtrips; dispatching them in one
+            # gather costs the slowest call instead of six in sequence
+            criterion_ids = list(self.CRITERIA)
+            results = await asyncio.gather(
+                *(
+                    self._evaluate_criterion(
+                        criterion_id, self.CRITERIA[criterion_id],
+                        conv_text, deep_thoughts
+                    )
+                    for criterion_id in criterion_ids
+                ),
+                self.llm_service.generate_response(
+                    messages=[{"role": "user", "content": summary_prompt}],
+                    system_prompt=self.system_prompt,
+                    max_tokens=self._SUMMARY_MAX_TOKENS,
+                    temperature=0.5
+                )
             )
+            conversation_summary = results[-1]
+
+            evaluations = {
+                criterion_id: {
+                    "name": self.CRITERIA[criterion_id]["name"],
+                    "score": score,
+                    "reasoning": reasoning,
+                }
+                for criterion_id, (score, reasoning)
+                in zip(criterion_ids, results)
+            }
+
+            # Calculate overall assessment
+            overall_score = self._calculate_overall_score(evaluations)
 
             # Format evaluation report with transcript
             eval_report = self._format_evaluation_report(
                 evaluations, overall_score, conversation, conversation_summary
             )
 
-            # Send evaluation metrics to LangSmith
-            await self._send_to_langsmith(
-                evaluations, overall_score, request, conversation
+            # Send evaluation metrics to LangSmith in the background;
+            # the caller shouldn't wait on telemetry round-trips
+            task = asyncio.create_task(
+                self._send_to_langsmith(
+                    evaluations, overall_score, request, conversation
+                )
             )
+            self._pending_telemetry.add(task)
+            task.add_done_callback(self._pending_telemetry.discard)
 
             return AgentResponse(
                 agent_name=self.name,
@@ -172,7 +296,7 @@ Be fair but rigorous in your assessment."""
         self,
         criterion_id: str,
         criterion_info: Dict[str, Any],
-        conversation: List[Dict[str, str]],
+        conv_text: str,
         deep_thoughts: str,
     ) -> tuple[float, str]:
         """Evaluate a single criterion.
@@ -180,22 +304,33 @@ Be fair but rigorous in your assessment."""
         Args:
             criterion_id: ID of the criterion (A-E)
             criterion_info: Information about the criterion
-            conversation: Conversation history
+            conv_text: Pre-formatted conversation transcript
             deep_thoughts: Deep Thoughts report
 
         Returns:
             Tuple of (score, reasoning)
         """
-        # Build evaluation prompt
-        eval_prompt = self._build_criterion_prompt(
-            criterion_id, criterion_info, conversation, deep_thoughts
+        # Replay identical evaluations from the opt-in cache
+        cache_key = None
+        if os.getenv("EVAL_CACHE") == "1":
+            cache_key = self._eval_cache_key(
+                criterion_id, conv_text, deep_thoughts
+            )
+            cached = self._eval_cache_get(cache_key)
+            if cached is not None:
+                logger.debug(f"Eval cache hit for criterion {criterion_id}")
+                return cached["score"], cached["reasoning"]
+
+        # Build evaluation prompt blocks
+        eval_blocks = self._build_criterion_prompt(
+            criterion_id, criterion_info, conv_text, deep_thoughts
         )
 
         # Get evaluation from LLM
         result = await self.llm_service.generate_response(
-            messages=[{"role": "user", "content": eval_prompt}],
+            messages=[{"role": "user", "content": eval_blocks}],
             system_prompt=self.system_prompt,
-            max_tokens=500,
+            max_tokens=self._CRITERION_MAX_TOKENS,
             temperature=0.3,
         )
 
@@ -209,90 +344,100 @@ Be fair but rigorous in your assessment."""
             if criterion_info["binary"]:
                 score = 1.0 if score >= 0.5 else 0.0
 
+            if cache_key is not None:
+                self._eval_cache_set(cache_key, score, reasoning)
+
             return score, reasoning
 
         except Exception as e:
             logger.error(f"Error parsing evaluation for {criterion_id}: {e}")
             return 0.0, f"Error parsing evaluation: {str(e)}"
 
+    def _eval_cache_key(
+        self, criterion_id: str, conv_text: str, deep_thoughts: str
+    ) -> str:
+        """Content hash identifying one criterion evaluation.
+
+        Any change to the inputs or the system prompt produces a new
+        key, so cached scores can never mask a prompt change.
+        """
+        payload = json.dumps(
+            [criterion_id, conv_text, deep_thoughts, self.system_prompt],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(
+            payload.encode(), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def _eval_cache_dir() -> str:
+        """Directory for cached criterion results."""
+        return os.getenv("EVAL_CACHE_DIR", _DEFAULT_EVAL_CACHE_DIR)
+
+    def _eval_cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Read a cached criterion result, or None on miss."""
+        path = os.path.join(self._eval_cache_dir(), f"{cache_key}.json")
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _eval_cache_set(
+        self, cache_key: str, score: float, reasoning: str
+    ) -> None:
+        """Persist a criterion result for identical future inputs."""
+        try:
+            cache_dir = self._eval_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, f"{cache_key}.json")
+            with open(path, "w") as f:
+                json.dump({"score": score, "reasoning": reasoning}, f)
+        except OSError as e:
+            logger.warning(f"Eval cache write failed: {e}")
+
     def _build_criterion_prompt(
         self,
         criterion_id: str,
         criterion_info: Dict[str, Any],
-        conversation: List[Dict[str, str]],
+        conv_text: str,
         deep_thoughts: str,
-    ) -> str:
-        """Build evaluation prompt for a specific criterion.
+    ) -> List[Dict[str, Any]]:
+        """Build evaluation prompt blocks for a specific criterion.
+
+        The transcript and Deep Thoughts report are identical across
+        all five criterion calls, so they form a shared leading block
+        marked with ``cache_control``; Anthropic's prompt caching
+        serves that prefix from cache for every call after the first.
+        Only the per-criterion task block varies.
 
         Args:
             criterion_id: ID of the criterion
             criterion_info: Information about the criterion
-            conversation: Conversation history
+            conv_text: Pre-formatted conversation transcript
             deep_thoughts: Deep Thoughts report
 
         Returns:
-            Formatted evaluation prompt
+            User message content blocks for the evaluation call
         """
-        # Format conversation
-        conv_text = self._format_conversation(conversation)
-
-        # Get specific evaluation instructions
-        if criterion_id == "A":
-            instructions = """Evaluate if the session helped client:
-1. Identify and clearly define their biggest/most important problem
-2. Understand why this specific problem matters to them
-3. Articulate the significance and impact of solving this problem
-
-Look for explicit problem identification and exploration of its importance."""
-
-        elif criterion_id == "B":
-            instructions = """Evaluate if the session helped client:
-1. Identify the key constraint or bottleneck (the 'crux') preventing progress
-2. Distinguish between symptoms and root causes
-3. Recognize what must be addressed first to unlock progress
-
-Look for deep analysis that goes beyond surface-level issues."""
-
-        elif criterion_id == "C":
-            instructions = """Evaluate if the session helped client:
-1. Define a specific, concrete action to take TODAY
-2. Connect this action directly to addressing the identified crux
-3. Make the action achievable and measurable
-
-Look for clear next steps, not vague intentions."""
-
-        elif criterion_id == "D":
-            instructions = """Evaluate how well the session:
-1. Explored multiple distinct approaches to address the crux
-2. Presented genuinely different paths (not variations of the same idea)
-3. Considered trade-offs and implications of each path
-
-Score from 0.0 (single path) to 1.0 (multiple creative options)."""
+        shared_context = f"""## Conversation Transcript
+{conv_text}
 
-        elif criterion_id == "E":
-            instructions = """Evaluate how well the session:
-1. Connected solutions to the client's core beliefs and values
-2. Referenced specific principles or tenets to guide action
-3. Aligned recommendations with what matters most to the client
+## Deep Thoughts Report
+{deep_thoughts}"""
 
-Score from 0.0 (no connection) to 1.0 (deep value alignment)."""
+        # Get specific evaluation instructions
+        instructions = criterion_info.get("instructions", "")
 
-        # Build complete prompt
         scoring = (
             "1 if fully achieved, 0 if not"
             if criterion_info["binary"]
             else "0.0 to 1.0"
         )
 
-        return f"""## Criterion {criterion_id}: {criterion_info['name']}
+        criterion_task = f"""## Criterion {criterion_id}: {criterion_info['name']}
 {criterion_info['description']}
 
-## Conversation Transcript
-{conv_text}
-
-## Deep Thoughts Report
-{deep_thoughts}
-
 ## Evaluation Task
 {instructions}
 
@@ -304,11 +449,24 @@ Return ONLY a JSON object:
   "reasoning": "[your explanation]"
 }}"""
 
-    def _format_conversation(self, conversation: List[Dict[str, str]]) -> str:
-        """Format conversation history for evaluation.
+        return [
+            {
+                "type": "text",
+                "text": shared_context,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": criterion_task},
+        ]
+
+    def _format_conversation(
+        self, conversation: List[Dict[str, str]], style: str = "numbered"
+    ) -> str:
+        """Format conversation history for prompts and reports.
 
         Args:
             conversation: List of conversation turns
+            style: "numbered" for evaluation prompts, "markdown" for
+                the report transcript
 
         Returns:
             Formatted conversation text
@@ -320,7 +478,10 @@ Return ONLY a JSON object:
         for i, turn in enumerate(conversation, 1):
             role = turn.get("role", "unknown").title()
             content = turn.get("content", "")
-            formatted.append(f"Turn {i} - {role}: {content}")
+            if style == "markdown":
+                formatted.append(f"**{role}**: {content}")
+            else:
+                formatted.append(f"Turn {i} - {role}: {content}")
 
         return "\n\n".join(formatted)
 
@@ -333,25 +494,25 @@ Return ONLY a JSON object:
         Returns:
             Parsed JSON dictionary
         """
-        json_str = result.strip()
-
-        # Handle markdown code blocks
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0].strip()
+        # Handle markdown code blocks with a single compiled-regex
+        # scan instead of split chains over the full response
+        fence_match = _FENCE_RE.search(result)
+        json_str = fence_match.group(1) if fence_match else result.strip()
 
         try:
             return json.loads(json_str)
         except json.JSONDecodeError:
-            # Try regex extraction as fallback
-            json_match = re.search(
-                r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", result, re.DOTALL
-            )
-            if json_match:
-                json_text = json_match.group()
-                json_text = json_text.replace("\n", " ").replace("\r", " ")
-                return json.loads(json_text)
+            # Fallback: scan for the first parseable JSON object
+            # embedded in surrounding prose. raw_decode parses exactly
+            # one value per attempt, so this stays linear-time and
+            # handles arbitrary nesting
+            start = result.find("{")
+            while start != -1:
+                try:
+                    parsed, _ = _JSON_DECODER.raw_decode(result, start)
+                    return parsed
+                except json.JSONDecodeError:
+                    start = result.find("{", start + 1)
             raise
 
     def _calculate_overall_score(self, evaluations: Dict[str, Dict[str, Any]]) -> float:
@@ -363,19 +524,11 @@ Return ONLY a JSON object:
         Returns:
             Overall score (0.0-1.0)
         """
-        # Weight binary criteria more heavily (they're foundational)
-        weights = {
-            "A": 0.25,  # Problem Definition
-            "B": 0.25,  # Crux Recognition
-            "C": 0.25,  # Today Accomplishment
-            "D": 0.125,  # Multiple Paths
-            "E": 0.125,  # Core Beliefs
-        }
-
-        total_score = 0.0
-        for criterion_id, weight in weights.items():
-            if criterion_id in evaluations:
-                total_score += evaluations[criterion_id]["score"] * weight
+        total_score = sum(
+            evaluations[criterion_id]["score"] * weight
+            for criterion_id, weight in self._WEIGHTS.items()
+            if criterion_id in evaluations
+        )
 
         return round(total_score, 2)
 
@@ -425,33 +578,11 @@ Return ONLY a JSON object:
 
         # Transcript
         lines.append("### Full Conversation Transcript\n")
-        transcript = self._format_conversation_transcript(conversation)
+        transcript = self._format_conversation(conversation, style="markdown")
         lines.append(transcript)
 
         return "\n".join(lines)
 
-    def _format_conversation_transcript(
-        self, conversation: List[Dict[str, str]]
-    ) -> str:
-        """Format conversation history as a readable transcript.
-
-        Args:
-            conversation: List of conversation turns
-
-        Returns:
-            Formatted transcript
-        """
-        if not conversation:
-            return "No conversation history available."
-
-        formatted = []
-        for turn in conversation:
-            role = turn.get("role", "unknown").title()
-            content = turn.get("content", "")
-            formatted.append(f"**{role}**: {content}")
-
-        return "\n\n".join(formatted)
-
     async def _send_to_langsmith(
         self, evaluations: Dict[str, Dict[str, Any]], overall_score: float,
         request: AgentRequest, conversation: List[Dict[str, str]]
@@ -469,11 +600,12 @@ Return ONLY a JSON object:
             logger.debug("LangSmith API key not configured, skipping metrics")
             return
 
-        try:
-            from langsmith import Client
-            from uuid import uuid4
+        if not LANGSMITH_AVAILABLE:
+            logger.warning("LangSmith not installed, skipping metrics")
+            return
 
-            client = Client()
+        try:
+            client = _get_langsmith_client()
 
             # Create experiment run for manual prototype sessions
             # This ensures manual runs are tracked the same way as automated evals
@@ -497,9 +629,12 @@ Return ONLY a JSON object:
                 }
             }
 
-            # Create the experiment run
+            # Create the experiment run. The LangSmith SDK is
+            # synchronous, so run each call in a worker thread to
+            # keep the event loop free for concurrent LLM I/O
             run_id = str(uuid4())
-            client.create_run(
+            await asyncio.to_thread(
+                client.create_run,
                 id=run_id,
                 name=experiment_name,
                 run_type="eval",
@@ -525,29 +660,34 @@ Return ONLY a JSON object:
                 }
             )
 
-            # Add evaluation feedback as scores
-            for criterion_id, eval_data in evaluations.items():
-                score_value = eval_data["score"]
-                client.create_feedback(
+            # Add per-criterion and overall feedback; the posts are
+            # independent, so issue them concurrently
+            feedback_calls = [
+                asyncio.to_thread(
+                    client.create_feedback,
                     run_id=run_id,
                     key=f"criterion_{criterion_id}",
-                    score=score_value,
+                    score=eval_data["score"],
                     comment=eval_data["reasoning"]
                 )
-
-            # Add overall score
-            client.create_feedback(
-                run_id=run_id,
-                key="overall_effectiveness",
-                score=overall_score,
-                comment=f"Overall coaching effectiveness: {overall_score:.1%}"
+                for criterion_id, eval_data in evaluations.items()
+            ]
+            feedback_calls.append(
+                asyncio.to_thread(
+                    client.create_feedback,
+                    run_id=run_id,
+                    key="overall_effectiveness",
+                    score=overall_score,
+                    comment=(
+                        f"Overall coaching effectiveness: {overall_score:.1%}"
+                    )
+                )
             )
+            await asyncio.gather(*feedback_calls)
 
             logger.info(
                 f"Sent evaluation to LangSmith: score={overall_score}"
             )
 
-        except ImportError:
-            logger.warning("LangSmith not installed, skipping metrics")
         except Exception as e:
             logger.error(f"Error sending metrics to LangSmith: {e}")
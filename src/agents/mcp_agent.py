@@ -1,7 +1,12 @@
 """MCP Agent for external service integration via Model Context Protocol."""
 
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any, List
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from src.agents.base import BaseAgent, AgentCapability, AgentRequest, AgentResponse
@@ -13,10 +18,25 @@ from src.performance.profiler import profile_async
 
 logger = logging.getLogger(__name__)
 
+# Sort order for task priorities, shared by every response format
+_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# Intent dispatch patterns, checked in priority order; a compiled
+# alternation scans the query once per intent instead of once per
+# keyword
+_STATUS_RE = re.compile(r"status|connection|connected")
+_TODAY_RE = re.compile(r"today")
+_OVERDUE_RE = re.compile(r"overdue")
+
 
 class MCPAgent(BaseAgent):
     """Agent responsible for MCP integrations - currently Todoist only."""
 
+    # Formatted responses are reused for repeated identical polls; the
+    # TTL is short so task changes still surface quickly
+    _RESPONSE_CACHE_TTL = 5.0
+    _RESPONSE_CACHE_MAX = 128
+
     def __init__(self):
         """Initialize MCP Agent with Todoist integration."""
         super().__init__(
@@ -25,6 +45,52 @@ class MCPAgent(BaseAgent):
         )
         self.mcp_node = MCPTodoNode()
         self.connection_status: Dict[str, Any] = {}
+        self._response_cache: OrderedDict = OrderedDict()
+        # In-flight background refresh of connection_status, if any
+        self._status_refresh: Optional[asyncio.Task] = None
+
+    def _cached_response(
+        self, key: Tuple, request: AgentRequest
+    ) -> Optional[AgentResponse]:
+        """Return a fresh AgentResponse for an unexpired cached entry."""
+        entry = self._response_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return AgentResponse(
+            agent_name=self.name,
+            content=entry[1],
+            metadata=entry[2],
+            request_id=request.request_id,
+            timestamp=datetime.now()
+        )
+
+    def _cache_response(self, key: Tuple, response: AgentResponse) -> None:
+        """Store formatted content and metadata under a short TTL."""
+        self._response_cache[key] = (
+            time.monotonic() + self._RESPONSE_CACHE_TTL,
+            response.content,
+            response.metadata
+        )
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self._RESPONSE_CACHE_MAX:
+            self._response_cache.popitem(last=False)
+
+    async def _refresh_connection_status(self) -> None:
+        """Refresh connection_status, swallowing background failures."""
+        try:
+            status = await self.mcp_node.get_mcp_status()
+        except Exception as e:
+            logger.debug(f"Background status refresh failed: {e}")
+            return
+        if isinstance(status, dict):
+            self.connection_status = status
+
+    def _warm_connection_status(self) -> None:
+        """Kick off a status refresh unless one is already in flight."""
+        if self._status_refresh is None or self._status_refresh.done():
+            self._status_refresh = asyncio.create_task(
+                self._refresh_connection_status()
+            )
 
     async def initialize(self) -> None:
         """Initialize MCP connections and verify status."""
@@ -66,11 +132,11 @@ class MCPAgent(BaseAgent):
             query_lower = request.query.lower()
 
             # Determine request type
-            if any(word in query_lower for word in ["status", "connection", "connected"]):
+            if _STATUS_RE.search(query_lower):
                 return await self._get_connection_status(request)
-            elif "today" in query_lower or "due today" in query_lower or "focus on tasks due today" in query_lower:
+            elif _TODAY_RE.search(query_lower):
                 return await self._get_tasks_with_filter(request, "today")
-            elif "overdue" in query_lower:
+            elif _OVERDUE_RE.search(query_lower):
                 return await self._get_tasks_with_filter(request, "overdue")
             else:
                 # General task fetch based on context
@@ -87,8 +153,29 @@ class MCPAgent(BaseAgent):
                 error=str(e)
             )
 
+    async def handle_requests_batch(
+        self, requests: List[AgentRequest]
+    ) -> List[AgentResponse]:
+        """Dispatch several MCP requests concurrently.
+
+        Args:
+            requests: The agent requests to handle
+
+        Returns:
+            AgentResponses in the same order as the requests
+        """
+        # handle_request already converts failures into error
+        # responses, so the gather never raises
+        return list(await asyncio.gather(
+            *(self.handle_request(request) for request in requests)
+        ))
+
     async def _get_connection_status(self, request: AgentRequest) -> AgentResponse:
         """Get current MCP connection status."""
+        cached = self._cached_response(("status",), request)
+        if cached is not None:
+            return cached
+
         # Refresh status
         self.connection_status = await self.mcp_node.get_mcp_status()
 
@@ -104,27 +191,41 @@ class MCPAgent(BaseAgent):
                 f"Error: {self.connection_status.get('error', 'Unknown error')}"
             )
 
-        return AgentResponse(
+        response = AgentResponse(
             agent_name=self.name,
             content=content,
             metadata=self.connection_status,
             request_id=request.request_id,
             timestamp=datetime.now()
         )
+        self._cache_response(("status",), response)
+        return response
 
     async def _get_tasks_with_filter(
         self, request: AgentRequest, date_filter: str
     ) -> AgentResponse:
         """Get tasks with specific date filter."""
-        # Try cache first
-        cache = get_cache()
         user_id = request.context.get("user_id", "default")
+        response_key = ("tasks", date_filter, user_id)
+        cached_response = self._cached_response(response_key, request)
+        if cached_response is not None:
+            return cached_response
+
+        # Warm the connection status off-path: a status round-trip
+        # opens a full MCP session, so the task path only reads the
+        # stored self.connection_status and never blocks on it
+        self._warm_connection_status()
+
+        cache = get_cache()
         cache_key = f"{date_filter}_{user_id}"
 
         cached_tasks = await cache.get_mcp_data("tasks", cache_key)
+
         if cached_tasks:
             logger.info(f"Cache hit for MCP tasks: {date_filter}")
-            return self._format_task_response(request, cached_tasks)
+            response = self._format_task_response(request, cached_tasks)
+            self._cache_response(response_key, response)
+            return response
 
         # Create a mock state for the MCP node
         mock_state = ContextState(
@@ -141,7 +242,11 @@ class MCPAgent(BaseAgent):
             await cache.set_mcp_data("tasks", cache_key, updated_state.todo_context)
             logger.debug(f"Cached MCP tasks for: {date_filter}")
 
-            return self._format_task_response(request, updated_state.todo_context)
+            response = self._format_task_response(
+                request, updated_state.todo_context
+            )
+            self._cache_response(response_key, response)
+            return response
         else:
             return AgentResponse(
                 agent_name=self.name,
@@ -173,8 +278,10 @@ class MCPAgent(BaseAgent):
 
         if updated_state.todo_context:
             response = self._format_task_response(request, updated_state.todo_context)
-            print(f"📤 MCP DEBUG: Returning response with content length: {len(response.content)}")
-            print(f"📤 MCP DEBUG: First 200 chars of response: {response.content[:200]}...")
+            logger.debug(
+                "MCP returning response: len=%d head=%r",
+                len(response.content), response.content[:200]
+            )
             return response
         else:
             # Check if it's due to low relevance or actual error
@@ -202,13 +309,15 @@ class MCPAgent(BaseAgent):
         self, request: AgentRequest, tasks: List[Dict[str, Any]]
     ) -> AgentResponse:
         """Format tasks into structured response."""
+        now = datetime.now()
+
         if not tasks:
             return AgentResponse(
                 agent_name=self.name,
                 content="No tasks found.",
                 metadata={"tasks_found": 0},
                 request_id=request.request_id,
-                timestamp=datetime.now()
+                timestamp=now
             )
 
         # Format tasks
@@ -216,19 +325,20 @@ class MCPAgent(BaseAgent):
 
         high_priority_count = 0
         due_today_count = 0
-        today = datetime.now().date().isoformat()
+        today = now.date().isoformat()
 
         # Sort tasks: due today first, then by priority
         def task_sort_key(task):
-            due_date = task.get("due_date")
-            is_due_today = due_date == today if due_date else False
-            priority_map = {"high": 0, "medium": 1, "low": 2}
-            priority_value = priority_map.get(task.get("priority", "low"), 2)
-            return (not is_due_today, priority_value)
+            return (
+                task.get("due_date") != today,
+                _PRIORITY_ORDER.get(task.get("priority", "low"), 2)
+            )
 
-        sorted_tasks = sorted(tasks, key=task_sort_key)
+        # Only the top 5 are shown, so select them without sorting
+        # the full task list
+        top_tasks = heapq.nsmallest(5, tasks, key=task_sort_key)
 
-        for task in sorted_tasks[:5]:  # Limit to top 5
+        for task in top_tasks:
             priority = task.get("priority", "low")
             content = task.get("content", "Untitled task")
             project = task.get("project", "Inbox")
@@ -283,5 +393,5 @@ class MCPAgent(BaseAgent):
                 "connected": self.connection_status.get("connected", False)
             },
             request_id=request.request_id,
-            timestamp=datetime.now()
+            timestamp=now
         )
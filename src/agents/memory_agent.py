@@ -1,14 +1,79 @@
 """Memory Agent for accessing and analyzing past conversations."""
 
+import asyncio
+import heapq
 import os
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from collections import Counter
+from collections import Counter, defaultdict
 import re
 
 from src.agents.base import BaseAgent, AgentCapability, AgentRequest, AgentResponse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, preferring the faster orjson when present."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode to a JSON string, preferring orjson when present."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _read_conversation_file(filepath: str) -> Optional[Dict[str, Any]]:
+    """Read and index one conversation file, or None if malformed."""
+    try:
+        with open(filepath, 'rb') as f:
+            conv_data = _json_loads(f.read())
+    except Exception:
+        # Skip malformed files
+        return None
+    MemoryAgent._index_messages(conv_data)
+    return conv_data
+
+
+# Intent dispatch patterns, checked in priority order; one compiled
+# alternation per intent replaces per-keyword substring checks
+_RECALL_RE = re.compile(r"remember when|last time")
+_PATTERNS_RE = re.compile(r"patterns|topics")
+_SUMMARY_RE = re.compile(r"summary")
+
+# Compiled keyword alternations for pattern extraction; one regex
+# pass per message replaces a Python loop of substring checks per
+# keyword list
+_CHALLENGE_RE = re.compile(
+    r"\b(?:problem|challenge|issue|struggle|difficult|organize|focus"
+    r"|productivity|clarity)\b"
+)
+_VALUE_RE = re.compile(
+    r"\b(?:value|believe|important|matter|care|purpose|meaning|growth"
+    r"|authenticity)\b"
+)
+_EMOTION_RE = re.compile(
+    r"\b(?:feel|feeling|anxious|worried|excited|happy|frustrated"
+    r"|overwhelmed|confident)\b"
+)
+
+# Search terms: 4+ letter words, used for both queries and the
+# per-message token sets built at load time
+_TOKEN_RE = re.compile(r"\b\w{4,}\b")
+
+# Adjacent pairs of 4+ letter words; the lookahead lets a word start
+# the next pair as well, matching the old sliding-window bigrams
+_BIGRAM_RE = re.compile(r"\b(\w{4,})\W+(?=(\w{4,})\b)")
+
 
 class MemoryAgent(BaseAgent):
     """Agent responsible for accessing and analyzing past conversations."""
@@ -26,11 +91,19 @@ class MemoryAgent(BaseAgent):
         self.conversations_dir = conversations_dir
         self.conversations_cache: List[Dict[str, Any]] = []
         self.patterns_cache: Dict[str, Any] = {}
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._patterns_response: Optional[str] = None
+        self._summary_response: Optional[str] = None
 
     async def initialize(self) -> None:
         """Load and pre-process conversation history."""
         self.conversations_cache = await self._load_conversations()
+        self._build_postings_index()
         self.patterns_cache = await self._extract_patterns()
+        # Patterns and summaries only change when history is reloaded,
+        # so serialize them once here; requests return the cached string
+        self._patterns_response = _json_dumps(self._get_conversation_patterns())
+        self._summary_response = _json_dumps(self._get_conversation_summary())
         self.is_initialized = True
 
     async def handle_request(self, request: AgentRequest) -> AgentResponse:
@@ -45,20 +118,29 @@ class MemoryAgent(BaseAgent):
         try:
             query_lower = request.query.lower()
 
-            # Determine request type
-            if "remember when" in query_lower or "last time" in query_lower:
-                result = await self._find_specific_memory(request.query)
-            elif "patterns" in query_lower or "topics" in query_lower:
-                result = self._get_conversation_patterns()
-            elif "summary" in query_lower:
-                result = self._get_conversation_summary()
+            # Determine request type; pattern and summary responses are
+            # pre-serialized at initialize() time
+            if _RECALL_RE.search(query_lower):
+                content = _json_dumps(
+                    await self._find_specific_memory(request.query)
+                )
+            elif _PATTERNS_RE.search(query_lower):
+                content = self._patterns_response or _json_dumps(
+                    self._get_conversation_patterns()
+                )
+            elif _SUMMARY_RE.search(query_lower):
+                content = self._summary_response or _json_dumps(
+                    self._get_conversation_summary()
+                )
             else:
                 # General search
-                result = await self._search_conversations(request.query)
+                content = _json_dumps(
+                    await self._search_conversations(request.query)
+                )
 
             return AgentResponse(
                 agent_name=self.name,
-                content=json.dumps(result),
+                content=content,
                 metadata={
                     "conversation_count": len(self.conversations_cache),
                     "patterns": list(self.patterns_cache.keys())
@@ -79,21 +161,22 @@ class MemoryAgent(BaseAgent):
 
     async def _load_conversations(self) -> List[Dict[str, Any]]:
         """Load all conversations from the conversations directory."""
-        conversations = []
-
         if not os.path.exists(self.conversations_dir):
-            return conversations
-
-        for filename in os.listdir(self.conversations_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.conversations_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        conv_data = json.load(f)
-                        conversations.append(conv_data)
-                except Exception:
-                    # Skip malformed files
-                    continue
+            return []
+
+        filepaths = [
+            os.path.join(self.conversations_dir, filename)
+            for filename in os.listdir(self.conversations_dir)
+            if filename.endswith('.json')
+        ]
+
+        # Read and index files on worker threads so disk I/O overlaps
+        # and the event loop stays free while other agents initialize
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(_read_conversation_file, filepath)
+              for filepath in filepaths)
+        )
+        conversations = [conv for conv in loaded if conv is not None]
 
         # Sort by timestamp (newest first)
         conversations.sort(
@@ -103,6 +186,32 @@ class MemoryAgent(BaseAgent):
 
         return conversations
 
+    @staticmethod
+    def _index_messages(conv_data: Dict[str, Any]) -> None:
+        """Precompute lowered content and token sets for each message.
+
+        Lowercasing and tokenizing happen once at load time so that
+        pattern extraction and every search reuse the results instead
+        of re-walking the raw text per query.
+        """
+        for msg in conv_data.get('messages', []):
+            lowered = msg.get('content', '').lower()
+            msg['_content_lower'] = lowered
+            msg['_token_set'] = frozenset(_TOKEN_RE.findall(lowered))
+
+    def _build_postings_index(self) -> None:
+        """Build an inverted index from token to message positions.
+
+        Searches then touch only the postings lists for their query
+        terms instead of walking the full corpus per request.
+        """
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for ci, conv in enumerate(self.conversations_cache):
+            for mi, msg in enumerate(conv.get('messages', [])):
+                for token in msg.get('_token_set', ()):
+                    postings[token].append((ci, mi))
+        self._postings = dict(postings)
+
     async def _extract_patterns(self) -> Dict[str, Any]:
         """Extract common patterns and topics from conversations."""
         patterns = {
@@ -113,50 +222,25 @@ class MemoryAgent(BaseAgent):
             "time_patterns": {}
         }
 
-        # Common patterns to look for
-        challenge_keywords = [
-            "problem", "challenge", "issue", "struggle", "difficult",
-            "organize", "focus", "productivity", "clarity"
-        ]
-
-        value_keywords = [
-            "value", "believe", "important", "matter", "care",
-            "purpose", "meaning", "growth", "authenticity"
-        ]
-
-        emotion_keywords = [
-            "feel", "feeling", "anxious", "worried", "excited",
-            "happy", "frustrated", "overwhelmed", "confident"
-        ]
-
         for conv in self.conversations_cache:
             messages = conv.get('messages', [])
 
             for msg in messages:
                 if msg.get('type') == 'user':
-                    content = msg.get('content', '').lower()
-
-                    # Extract challenges
-                    for keyword in challenge_keywords:
-                        if keyword in content:
-                            patterns["challenges"][keyword] += 1
-
-                    # Extract values
-                    for keyword in value_keywords:
-                        if keyword in content:
-                            patterns["values"][keyword] += 1
-
-                    # Extract emotions
-                    for keyword in emotion_keywords:
-                        if keyword in content:
-                            patterns["emotions"][keyword] += 1
-
-                    # Extract general topics (2-3 word phrases)
-                    words = re.findall(r'\b\w+\b', content)
-                    for i in range(len(words) - 1):
-                        bigram = f"{words[i]} {words[i+1]}"
-                        if len(words[i]) > 3 and len(words[i+1]) > 3:
-                            patterns["topics"][bigram] += 1
+                    content = msg.get('_content_lower', '')
+
+                    # Extract challenges, values and emotions
+                    patterns["challenges"].update(
+                        _CHALLENGE_RE.findall(content)
+                    )
+                    patterns["values"].update(_VALUE_RE.findall(content))
+                    patterns["emotions"].update(_EMOTION_RE.findall(content))
+
+                    # Extract general topics (adjacent word pairs)
+                    patterns["topics"].update(
+                        f"{first} {second}"
+                        for first, second in _BIGRAM_RE.findall(content)
+                    )
 
         # Keep only top patterns
         for category in ["challenges", "values", "topics", "emotions"]:
@@ -166,43 +250,52 @@ class MemoryAgent(BaseAgent):
 
     async def _find_specific_memory(self, query: str) -> Dict[str, Any]:
         """Find specific memories based on query."""
-        results = []
         query_lower = query.lower()
 
         # Extract key terms from query
-        key_terms = re.findall(r'\b\w{4,}\b', query_lower)
+        key_terms = frozenset(_TOKEN_RE.findall(query_lower))
 
-        for conv in self.conversations_cache:
-            relevance_score = 0
-            matching_messages = []
-
-            for msg in conv.get('messages', []):
-                content_lower = msg.get('content', '').lower()
-
-                # Check for key term matches
-                matches = sum(1 for term in key_terms if term in content_lower)
-                if matches > 0:
-                    relevance_score += matches
-                    matching_messages.append({
-                        "content": msg.get('content'),
-                        "timestamp": msg.get('timestamp'),
-                        "type": msg.get('type')
-                    })
-
-            if relevance_score > 0:
-                results.append({
-                    "conversation_id": conv.get('conversation_id'),
-                    "timestamp": conv.get('timestamp'),
-                    "relevance_score": relevance_score,
-                    "matching_messages": matching_messages[:3]  # Top 3
-                })
-
-        # Sort by relevance
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Accumulate per-message match counts from the postings lists;
+        # only messages containing a query term are ever touched
+        message_scores: Counter = Counter()
+        for term in key_terms:
+            message_scores.update(self._postings.get(term, ()))
+
+        conv_hits: Dict[int, List[int]] = defaultdict(list)
+        for ci, mi in message_scores:
+            conv_hits[ci].append(mi)
+
+        results = []
+        for ci, message_indices in conv_hits.items():
+            conv = self.conversations_cache[ci]
+            messages = conv.get('messages', [])
+            message_indices.sort()
+
+            results.append({
+                "conversation_id": conv.get('conversation_id'),
+                "timestamp": conv.get('timestamp'),
+                "relevance_score": sum(
+                    message_scores[(ci, mi)] for mi in message_indices
+                ),
+                "matching_messages": [
+                    {
+                        "content": messages[mi].get('content'),
+                        "timestamp": messages[mi].get('timestamp'),
+                        "type": messages[mi].get('type')
+                    }
+                    for mi in message_indices[:3]  # Top 3
+                ]
+            })
+
+        # Top 5 conversations by relevance; nlargest avoids sorting
+        # the full result list when only the head is returned
+        top_results = heapq.nlargest(
+            5, results, key=lambda x: x['relevance_score']
+        )
 
         return {
             "query": query,
-            "results": results[:5],  # Top 5 conversations
+            "results": top_results,
             "total_found": len(results)
         }
 
@@ -8,6 +8,21 @@ from src.agents.protocol_state_parser import ProtocolStateParser, ProtocolState
 class MorningProtocolTracker:
     """Tracks morning protocol state and provides phase transition nudges."""
 
+    # Compiled once at class level; tried in order so the more specific
+    # "crux is/seems to be" form wins over the bare "The crux" form
+    _CRUX_PATTERNS = (
+        re.compile(r"crux (?:is|seems to be|might be) ([^.!?]+)", re.IGNORECASE),
+        re.compile(r"The crux[:]? ([^.!?]+)", re.IGNORECASE),
+    )
+
+    # One alternation scan replaces a substring check per indicator;
+    # no word boundaries so substring semantics are unchanged
+    _PROBLEM_RE = re.compile(
+        r"need to|have to|problem is|challenge is|struggling with"
+        r"|working on|goal is|want to|trying to|figure out|deal with"
+        r"|handle"
+    )
+
     def __init__(self, protocol_text: str):
         # Parse states from protocol
         self.states = ProtocolStateParser.parse_protocol(protocol_text)
@@ -26,6 +41,17 @@ class MorningProtocolTracker:
             self.state_exchanges[state.number] = 0
         self.total_exchanges = 0
 
+        # One escaped alternation per state scans each message once
+        # instead of once per completion indicator
+        self._indicator_res: Dict[int, Optional[re.Pattern]] = {}
+        for state in self.states:
+            indicators = [
+                re.escape(ind) for ind in state.completion_indicators if ind
+            ]
+            self._indicator_res[state.number] = (
+                re.compile("|".join(indicators)) if indicators else None
+            )
+
     def analyze_exchange(
         self,
         user_message: str,
@@ -78,21 +104,23 @@ class MorningProtocolTracker:
         assistant_msg: str
     ) -> bool:
         """Check if the current state's objectives have been completed."""
-        user_lower = user_msg.lower()
-        assistant_lower = assistant_msg.lower()
+        pattern = self._indicator_res.get(state.number)
+        if pattern is None:
+            return False
 
         # Check against completion indicators
-        for indicator in state.completion_indicators:
-            if indicator in user_lower or indicator in assistant_lower:
-                # Special handling for specific states
-                if state.number == 1 and "problem" in state.title.lower():
-                    self.problem = user_msg
-                elif state.number == 2 and "crux" in state.title.lower():
-                    if indicator in assistant_lower:
-                        self.crux = self._extract_crux(assistant_msg)
-                return True
-
-        return False
+        user_hit = pattern.search(user_msg.lower())
+        assistant_hit = pattern.search(assistant_msg.lower())
+        if not (user_hit or assistant_hit):
+            return False
+
+        # Special handling for specific states
+        if state.number == 1 and "problem" in state.title.lower():
+            self.problem = user_msg
+        elif state.number == 2 and "crux" in state.title.lower():
+            if assistant_hit:
+                self.crux = self._extract_crux(assistant_msg)
+        return True
 
     def _generate_state_nudge(self, state: ProtocolState) -> str:
         """Generate a nudge specific to the current state."""
@@ -108,22 +136,13 @@ class MorningProtocolTracker:
 
     def _contains_problem_statement(self, message: str) -> bool:
         """Check if message contains a problem statement."""
-        problem_indicators = [
-            "need to", "have to", "problem is", "challenge is",
-            "struggling with", "working on", "goal is", "want to",
-            "trying to", "figure out", "deal with", "handle"
-        ]
-        return any(ind in message.lower() for ind in problem_indicators)
+        return self._PROBLEM_RE.search(message.lower()) is not None
 
     def _extract_crux(self, response: str) -> str:
         """Extract crux statement from assistant response."""
         # Simple extraction - look for "crux is" or similar
-        patterns = [
-            r"crux (?:is|seems to be|might be) ([^.!?]+)",
-            r"The crux[:]? ([^.!?]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, response, re.IGNORECASE)
+        for pattern in self._CRUX_PATTERNS:
+            match = pattern.search(response)
             if match:
                 return match.group(1).strip()
         return "crux not clearly stated"
@@ -41,9 +41,13 @@ class PromptLoader:
         Raises:
             FileNotFoundError: If the prompt file doesn't exist
         """
-        # Use cache if available
-        if prompt_name in cls._cache:
-            return cls._cache[prompt_name]
+        # Serve from cache with a single dict lookup. This class-level
+        # cache is deliberate over functools.lru_cache on the module
+        # helpers: clear_cache() must be able to invalidate for prompt
+        # hot-reload, which lru_cache-wrapped functions would defeat
+        cached = cls._cache.get(prompt_name)
+        if cached is not None:
+            return cached
 
         # Construct path to prompt file
         prompts_dir = Path(__file__).parent
@@ -5,6 +5,8 @@ from typing import Dict, List, Callable, Any, Awaitable
 from collections import defaultdict
 import redis.asyncio as redis
 
+from src.utils.serialization import to_json
+
 # Type aliases (same as in-memory bus)
 Event = Dict[str, Any]
 EventHandler = Callable[[Event], Awaitable[None]]
@@ -37,8 +39,8 @@ class RedisEventBus:
     
     async def publish(self, channel: str, event: Event) -> None:
         """Publish an event to a channel"""
-        # Serialize event to JSON
-        event_data = json.dumps(event)
+        # Serialize event to JSON (orjson-backed when available)
+        event_data = to_json(event)
         await self._redis.publish(channel, event_data)
     
     async def unsubscribe(self, channel: str, handler: EventHandler) -> None:
@@ -7,7 +7,9 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from rich.console import Console
 from rich.markdown import Markdown
-from src.agents.enhanced_coach_agent import EnhancedDiaryCoach
+from src.agents.enhanced_coach_agent import (
+    EnhancedDiaryCoach, multi_agent_enabled
+)
 from src.evaluation.performance_tracker import PerformanceTracker
 from src.evaluation.reporting.deep_thoughts import DeepThoughtsGenerator
 from src.services.llm_factory import LLMTier
@@ -32,10 +34,9 @@ class MultiAgentCLI:
 
     def __init__(self):
         """Initialize multi-agent CLI with all agents."""
-        # Check if multi-agent mode is disabled
-        self.multi_agent_enabled = (
-            os.getenv("DISABLE_MULTI_AGENT", "false").lower() != "true"
-        )
+        # Check if multi-agent mode is disabled; the same helper backs
+        # the coach, so CLI and coach can never disagree on the flag
+        self.multi_agent_enabled = multi_agent_enabled()
 
         # Create LLM service (Sonnet for both coach and orchestrator)
         self.llm_service = LLMFactory.create_standard_service()
@@ -304,7 +305,7 @@ class MultiAgentCLI:
                     # Get the most recent agent calls
                     recent_calls = [
                         call for call in self.coach.agent_call_history
-                        if (datetime.now() - call['timestamp']).seconds < 5
+                        if time.monotonic() - call['timestamp'] < 5
                     ]
                     if recent_calls:
                         agents_list = ', '.join(
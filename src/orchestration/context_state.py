@@ -16,6 +16,8 @@ class ContextState:
     
     # Context data channels
     todo_context: Optional[List[Dict[str, Any]]] = None
+    project_context: Optional[List[Dict[str, Any]]] = None
+    label_context: Optional[List[Dict[str, Any]]] = None
     document_context: Optional[Dict[str, Any]] = None
     conversation_history: Optional[List[Dict[str, Any]]] = None
     memory_recall: Optional[str] = None
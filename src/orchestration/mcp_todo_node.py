@@ -1,5 +1,6 @@
 """MCP Todo Node for Session 6.2 - Official Doist MCP Server Integration."""
 
+import asyncio
 import json
 import logging
 import os
@@ -133,10 +134,11 @@ class MCPTodoNode:
             # print(f"📥 MCP DEBUG: Raw todos fetched: {len(todos)}")
             
             # Filter todos based on conversation context
-            print("🔍 MCP DEBUG: Filtering todos by context...")
-            print(f"📝 MCP DEBUG: Latest message: {state.messages[-1] if state.messages else 'No messages'}")
             filtered_todos = self._filter_todos_by_context(todos, state)
-            print(f"✅ MCP DEBUG: Filtered todos: {len(filtered_todos)} (from {len(todos)} total)")
+            logger.debug(
+                "Filtered todos: %d (from %d total)",
+                len(filtered_todos), len(todos)
+            )
             
             # Update state
             state.todo_context = filtered_todos
@@ -156,33 +158,26 @@ class MCPTodoNode:
     
     async def _fetch_todos_from_mcp(self, date_filter: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch todos from Todoist via MCP server."""
-        print("🔑 MCP DEBUG: Checking API token...")
         token = self._get_api_token()
         if not token:
-            print("❌ MCP DEBUG: No API token found, using mock data")
-            # Fall back to mock data if no API token
+            logger.debug("No API token found, returning empty todo list")
             return self._get_mock_todos()
         
-        print(f"✅ MCP DEBUG: API token found: {token[:10]}...")
-        
         # Use a simpler approach with proper exception handling
         try:
             result = await self._call_mcp_safely(date_filter=date_filter)
             if result:
-                print(f"🎉 MCP DEBUG: Successfully fetched {len(result)} real todos")
+                logger.debug("Successfully fetched %d real todos", len(result))
                 return result
             else:
-                print("⚠️ MCP DEBUG: Empty result, using mock data")
                 return self._get_mock_todos()
                 
         except Exception as e:
             logger.error(f"Error fetching todos from MCP server: {e}")
-            print(f"❌ MCP DEBUG: MCP call failed: {e}")
             return self._get_mock_todos()  # Fallback to mock data
     
     def _get_mock_todos(self) -> List[Dict[str, Any]]:
         """Return empty list instead of mock data to avoid confusion."""
-        print("⚠️ MCP DEBUG: Returning empty todo list (no mock data)")
         return []
     
     async def _call_mcp_safely(self, date_filter: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -193,12 +188,11 @@ class MCPTodoNode:
         
         try:
             # Create the stdio connection
-            print("🔌 MCP DEBUG: Creating stdio connection...")
             stdio_context = stdio.stdio_client(self.server_params)
             
             # Get the streams
             read_stream, write_stream = await stdio_context.__aenter__()
-            print("✅ MCP DEBUG: Stdio connection established")
+            logger.debug("Stdio connection established")
             
             # Create the session
             # print("🤝 MCP DEBUG: Creating client session...")
@@ -215,84 +209,15 @@ class MCPTodoNode:
             params = {}
             if date_filter:
                 params["filter"] = date_filter
-                print(f"📅 MCP DEBUG: Using date filter: {date_filter}")
-            else:
-                print("📅 MCP DEBUG: No date filter applied")
+                logger.debug("Using date filter: %s", date_filter)
             
             # Call the get-tasks tool (note: hyphen, not underscore)
-            print("📋 MCP DEBUG: Calling get-tasks tool...")
             result = await session.call_tool("get-tasks", params)
             # print(f"✅ MCP DEBUG: get-tasks call completed")
-            
-            if not result.content:
-                # print("⚠️ MCP DEBUG: No content in result")
-                return []
-            
-            # Parse the response - handle different MCP response formats
-            # print("🔍 MCP DEBUG: Parsing response...")
-            if isinstance(result.content, list):
-                # Content is a list of TextContent objects
-                tasks_data = []
-                for item in result.content:
-                    if hasattr(item, 'text'):
-                        # Parse JSON from TextContent
-                        task_json = json.loads(item.text)
-                        tasks_data.append(task_json)
-                    else:
-                        tasks_data.append(item)
-            elif isinstance(result.content, str):
-                tasks_data = json.loads(result.content)
-            else:
-                tasks_data = result.content
-                
-            # print(f"📊 MCP DEBUG: Parsed {len(tasks_data)} tasks from response")
-            
-            # Convert to our format
-            todos = []
-            today = datetime.now().date().isoformat()
-            print(f"📅 MCP DEBUG: Today's date is {today}")
-            
-            today_count = 0
-            for task in tasks_data:
-                try:
-                    # Try multiple date field locations
-                    due_date = None
-                    
-                    # First try direct 'date' field
-                    if task.get("date"):
-                        due_date = task.get("date")
-                        print(f"📅 MCP DEBUG: Found date in 'date' field: {due_date}")
-                    # Then try 'due.date' structure
-                    elif task.get("due", {}).get("date"):
-                        due_date = task.get("due", {}).get("date")
-                        print(f"📅 MCP DEBUG: Found date in 'due.date' field: {due_date}")
-                    
-                    # Debug: print first few tasks to see structure
-                    if len(todos) < 3:
-                        print(f"🔍 MCP DEBUG: Task structure sample: {json.dumps(task, indent=2)[:500]}...")
-                    
-                    if due_date == today:
-                        today_count += 1
-                        print(f"📌 MCP DEBUG: Found task due today: {task.get('content')[:50]}...")
-                    
-                    todo = {
-                        "id": task.get("id"),
-                        "content": task.get("content"),
-                        "priority": self._map_priority(task.get("priority", 1)),
-                        "due_date": due_date,
-                        "project": task.get("project_name", "Inbox"),
-                        "labels": task.get("labels", []),
-                        "created_date": task.get("created_at"),
-                        "url": task.get("url")
-                    }
-                    todos.append(todo)
-                except Exception as e:
-                    logger.error(f"Error processing task {task}: {e}")
-                    continue
-            
-            print(f"✅ MCP DEBUG: Converted {len(todos)} tasks, {today_count} due today")
-            return todos
-            
+
+            tasks_data = self._parse_tool_result(result)
+            return self._convert_tasks(tasks_data)
+
         except Exception as e:
             # print(f"❌ MCP DEBUG: Error in _call_mcp_safely: {e}")
             raise e
@@ -316,7 +241,175 @@ class MCPTodoNode:
                 pass
     
     # Removed mock todo functionality - use real MCP only
-    
+
+    @staticmethod
+    def _parse_tool_result(result) -> List[Dict[str, Any]]:
+        """Parse an MCP tool result into Python data.
+
+        Handles TextContent lists, raw JSON strings and already-parsed
+        content.
+        """
+        if not result.content:
+            return []
+        if isinstance(result.content, list):
+            # Content is a list of TextContent objects
+            data = []
+            for item in result.content:
+                if hasattr(item, 'text'):
+                    # Parse JSON from TextContent
+                    data.append(json.loads(item.text))
+                else:
+                    data.append(item)
+            return data
+        if isinstance(result.content, str):
+            return json.loads(result.content)
+        return result.content
+
+    def _convert_tasks(self, tasks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert raw Todoist task dicts to our todo format."""
+        todos = []
+        today = datetime.now().date().isoformat()
+
+        today_count = 0
+        for task in tasks_data:
+            try:
+                # Try multiple date field locations: direct 'date' field
+                # first, then the 'due.date' structure
+                due_date = None
+                if task.get("date"):
+                    due_date = task.get("date")
+                elif task.get("due", {}).get("date"):
+                    due_date = task.get("due", {}).get("date")
+
+                if due_date == today:
+                    today_count += 1
+
+                # Normalized shape: every key is always present with a
+                # usable value, so downstream formatters can index
+                # directly instead of chaining .get() fallbacks
+                todo = {
+                    "id": task.get("id"),
+                    "content": task.get("content") or "No content",
+                    "priority": self._map_priority(task.get("priority", 1)),
+                    "due_date": due_date,
+                    "project": task.get("project_name", "Inbox"),
+                    "labels": task.get("labels", []),
+                    "created_date": task.get("created_at"),
+                    "url": task.get("url")
+                }
+                todos.append(todo)
+            except Exception as e:
+                logger.error(f"Error processing task {task}: {e}")
+                continue
+
+        logger.debug(
+            "Converted %d tasks, %d due today", len(todos), today_count
+        )
+        return todos
+
+    async def fetch_bundle(self, state: ContextState, date_filter: Optional[str] = None) -> ContextState:
+        """Fetch tasks, projects and labels in one batched MCP session.
+
+        Replaces three serial connect/call round-trips with a single
+        connection whose tool calls run concurrently.
+        """
+        relevance = state.context_relevance.get("todos", 0.0)
+
+        if not state.context_usage:
+            state.context_usage = {}
+
+        if relevance < 0.3:
+            state.context_usage["todos_fetched"] = False
+            state.decision_path.append("todo_context")
+            return state
+
+        try:
+            bundle = await self._fetch_bundle_from_mcp(date_filter=date_filter)
+            filtered_todos = self._filter_todos_by_context(bundle["tasks"], state)
+
+            state.todo_context = filtered_todos
+            state.project_context = bundle["projects"] or None
+            state.label_context = bundle["labels"] or None
+            state.context_usage["todos_fetched"] = True
+            state.context_usage["filter_applied"] = True
+            state.context_usage["total_todos"] = len(bundle["tasks"])
+            state.context_usage["filtered_todos"] = len(filtered_todos)
+
+        except Exception as e:
+            logger.error(f"Error fetching todo bundle: {e}")
+            state.todo_context = None
+            state.context_usage["todos_fetched"] = False
+            state.context_usage["error"] = str(e)
+
+        state.decision_path.append("todo_context")
+        return state
+
+    async def fetch_bundle_raw(
+        self, message_content: str, date_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch and filter todos for one message without ContextState.
+
+        Hot-path entry point for callers that have already gated on
+        relevance and only need the filtered todo list: skips the
+        dataclass construction and usage bookkeeping that
+        ``fetch_bundle`` performs. Errors propagate to the caller.
+        """
+        bundle = await self._fetch_bundle_from_mcp(date_filter=date_filter)
+        return self._filter_todos_by_content(bundle["tasks"], message_content)
+
+    async def _fetch_bundle_from_mcp(self, date_filter: Optional[str] = None) -> Dict[str, List]:
+        """Fetch tasks, projects and labels over a single MCP session."""
+        token = self._get_api_token()
+        if not token:
+            return {"tasks": [], "projects": [], "labels": []}
+
+        session = None
+        read_stream = None
+        write_stream = None
+
+        try:
+            stdio_context = stdio.stdio_client(self.server_params)
+            read_stream, write_stream = await stdio_context.__aenter__()
+
+            session = ClientSession(read_stream, write_stream)
+            await session.__aenter__()
+            await session.initialize()
+
+            params = {}
+            if date_filter:
+                params["filter"] = date_filter
+
+            # One session, three concurrent tool calls
+            tasks_res, projects_res, labels_res = await asyncio.gather(
+                session.call_tool("get-tasks", params),
+                session.call_tool("get-projects", {}),
+                session.call_tool("get-labels", {}),
+                return_exceptions=True
+            )
+
+            bundle: Dict[str, List] = {"tasks": [], "projects": [], "labels": []}
+            if not isinstance(tasks_res, Exception):
+                bundle["tasks"] = self._convert_tasks(
+                    self._parse_tool_result(tasks_res)
+                )
+            if not isinstance(projects_res, Exception):
+                bundle["projects"] = self._parse_tool_result(projects_res)
+            if not isinstance(labels_res, Exception):
+                bundle["labels"] = self._parse_tool_result(labels_res)
+            return bundle
+
+        finally:
+            try:
+                if session:
+                    await session.__aexit__(None, None, None)
+            except Exception:
+                pass
+            try:
+                if read_stream and write_stream:
+                    await stdio_context.__aexit__(None, None, None)
+            except Exception:
+                pass
+
     def _map_priority(self, todoist_priority: int) -> str:
         """Map Todoist priority (1-4) to our priority system."""
         if todoist_priority == 4:
@@ -338,17 +431,23 @@ class MCPTodoNode:
         """Filter todos based on conversation context."""
         if not state.messages:
             return todos[:10]  # Return top 10 if no context
-        
+
         # Get the latest message for context
         latest_message = state.messages[-1]
-        content = latest_message.get("content", "").lower()
-        
+        return self._filter_todos_by_content(
+            todos, latest_message.get("content", "")
+        )
+
+    def _filter_todos_by_content(self, todos: List[Dict[str, Any]], content: str) -> List[Dict[str, Any]]:
+        """Filter todos based on the text of a single message."""
+        content = content.lower()
+
         # Check if user is asking for general todo list
         general_queries = ["my todos", "my tasks", "what are my", "show me my", "list my", "today"]
         is_general_query = any(query in content for query in general_queries)
         
         if is_general_query:
-            print("📋 MCP DEBUG: General todo query detected, returning all todos")
+            logger.debug("General todo query detected, returning all todos")
             # For general queries, prioritize by due date and priority
             today = datetime.now().date().isoformat()
             todos_with_scores = []
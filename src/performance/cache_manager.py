@@ -324,20 +324,38 @@ class CacheManager:
 
     # Convenience methods for specific data types
 
-    async def get_coach_response(self, query: str) -> Optional[str]:
+    @staticmethod
+    def _coach_namespace(context_key: str) -> str:
+        """Namespace for coach responses, scoped by conversation context.
+
+        Scoping both exact and semantic lookups to the context digest
+        keeps a reply generated under one system prompt / history /
+        temperature from being replayed in a different conversation.
+        """
+        if context_key:
+            return f"coach_response_{context_key}"
+        return "coach_response"
+
+    async def get_coach_response(
+        self, query: str, context_key: str = ""
+    ) -> Optional[str]:
         """Get cached coach response"""
+        namespace = self._coach_namespace(context_key)
+
         # Try exact match first
-        response = await self.get("coach_response", query)
+        response = await self.get(namespace, query)
         if response:
             return response
 
-        # Try semantic similarity
-        return await self.get_semantic("coach_response", query)
+        # Try semantic similarity (within the same context)
+        return await self.get_semantic(namespace, query)
 
-    async def set_coach_response(self, query: str, response: str):
+    async def set_coach_response(
+        self, query: str, response: str, context_key: str = ""
+    ):
         """Cache coach response"""
         await self.set(
-            "coach_response",
+            self._coach_namespace(context_key),
             query,
             response,
             ttl=self.config.coach_response_ttl
@@ -18,28 +18,55 @@ class LLMTier(Enum):
 
 class LLMFactory:
     """Factory for creating LLM services based on tier and use case."""
-    
+
+    # Memoized services keyed by (tier, api_key, openai_key) so repeated
+    # agent construction reuses HTTP clients instead of re-initializing them
+    _service_cache: dict = {}
+
     @staticmethod
     def create_service(
         tier: LLMTier,
         api_key: Optional[str] = None,
         openai_key: Optional[str] = None
     ) -> Union[AnthropicService, OpenAIService]:
-        """Create an LLM service based on tier.
-        
+        """Create or reuse an LLM service based on tier.
+
+        Services are cached per (tier, api_key, openai_key) so agents that
+        are recreated per request share one underlying HTTP client.
+
         Args:
             tier: The LLM tier to use
             api_key: Anthropic API key (optional)
             openai_key: OpenAI API key (optional)
-            
+
         Returns:
             Appropriate LLM service instance
-            
+
         Raises:
             ValueError: If tier is not supported or required dependencies missing
         """
+        cache_key = (tier, api_key, openai_key)
+        cached = LLMFactory._service_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        service = LLMFactory._build_service(tier, api_key, openai_key)
+        LLMFactory._service_cache[cache_key] = service
+        return service
+
+    @staticmethod
+    def reset() -> None:
+        """Clear the service cache (primarily for tests)."""
+        LLMFactory._service_cache.clear()
+
+    @staticmethod
+    def _build_service(
+        tier: LLMTier,
+        api_key: Optional[str] = None,
+        openai_key: Optional[str] = None
+    ) -> Union[AnthropicService, OpenAIService]:
+        """Construct a fresh service instance for the given tier."""
         tier_str = tier.value
-        
+
         if tier == LLMTier.CHEAP:
             if not OPENAI_AVAILABLE:
                 # Fallback to cheap Anthropic model
@@ -47,15 +74,15 @@ class LLMFactory:
                 return AnthropicService(api_key, model=model)
             model = get_model_for_tier(tier_str, ModelProvider.OPENAI)
             return OpenAIService(api_key=openai_key, model=model)
-        
+
         elif tier == LLMTier.STANDARD:
             model = get_model_for_tier(tier_str, ModelProvider.ANTHROPIC)
             return AnthropicService(api_key, model=model)
-        
+
         elif tier == LLMTier.PREMIUM:
             model = get_model_for_tier(tier_str, ModelProvider.ANTHROPIC)
             return AnthropicService(api_key, model=model)
-        
+
         elif tier == LLMTier.O3:
             if not OPENAI_AVAILABLE:
                 # Fallback to premium Anthropic model
@@ -65,10 +92,10 @@ class LLMFactory:
             # For now, use gpt-4o-2024-11-20 (latest available version)
             model = get_model_for_tier("premium", ModelProvider.OPENAI)
             return OpenAIService(api_key=openai_key, model=model)
-        
+
         else:
             raise ValueError(f"Unsupported LLM tier: {tier}")
-    
+
     @staticmethod
     def create_cheap_service(
         api_key: Optional[str] = None,
@@ -76,21 +103,21 @@ class LLMFactory:
     ) -> Union[AnthropicService, OpenAIService]:
         """Create a cheap LLM service for frequent testing."""
         return LLMFactory.create_service(LLMTier.CHEAP, api_key, openai_key)
-    
+
     @staticmethod
     def create_standard_service(api_key: Optional[str] = None) -> AnthropicService:
         """Create a standard LLM service for regular use."""
         return LLMFactory.create_service(LLMTier.STANDARD, api_key)
-    
+
     @staticmethod
     def create_premium_service(api_key: Optional[str] = None) -> AnthropicService:
         """Create a premium LLM service for high-quality analysis."""
         return LLMFactory.create_service(LLMTier.PREMIUM, api_key)
-    
+
     @staticmethod
     def create_o3_service(
         api_key: Optional[str] = None,
         openai_key: Optional[str] = None
     ) -> Union[AnthropicService, OpenAIService]:
         """Create an O3 LLM service for Deep Thoughts analysis."""
-        return LLMFactory.create_service(LLMTier.O3, api_key, openai_key)
\ No newline at end of file
+        return LLMFactory.create_service(LLMTier.O3, api_key, openai_key)
@@ -2,7 +2,7 @@
 
 import asyncio
 import os
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Union
 from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 from src.config import get_model_config, calculate_cost
@@ -70,10 +70,44 @@ class AnthropicService:
             except Exception as e:
                 print(f"Warning: LangSmith initialization failed: {e}")
 
+    @staticmethod
+    def _mark_history_cache(
+        messages: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """Mark the conversation prefix as cacheable for Anthropic.
+
+        Wraps the second-to-last message's content in a block carrying
+        ``cache_control: ephemeral`` so the growing history prefix is
+        served from the prompt cache; the final (new) message stays
+        uncached since it is the actual per-turn delta.
+
+        Args:
+            messages: List of conversation messages
+
+        Returns:
+            A shallow copy with the cache breakpoint applied, or the
+            original list when there is no prefix to cache
+        """
+        if len(messages) < 2:
+            return messages
+        breakpoint_msg = messages[-2]
+        if not isinstance(breakpoint_msg.get("content"), str):
+            return messages
+        marked = list(messages)
+        marked[-2] = {
+            "role": breakpoint_msg["role"],
+            "content": [{
+                "type": "text",
+                "text": breakpoint_msg["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
+        }
+        return marked
+
     async def generate_response(
         self,
         messages: List[Dict[str, str]],
-        system_prompt: Optional[str] = None,
+        system_prompt: Optional[Union[str, List[Dict]]] = None,
         max_tokens: int = 200,
         temperature: float = 0.7,
         tools: Optional[List[Dict]] = None
@@ -82,7 +116,9 @@ class AnthropicService:
 
         Args:
             messages: List of conversation messages
-            system_prompt: Optional system prompt
+            system_prompt: Optional system prompt - either a plain string
+                or a list of content blocks (e.g. with cache_control
+                markers for Anthropic prompt caching)
             max_tokens: Maximum tokens to generate
             temperature: Response randomness (0-1)
 
@@ -102,7 +138,7 @@ class AnthropicService:
                     "model": self.model,
                     "max_tokens": max_tokens,
                     "temperature": temperature,
-                    "messages": messages
+                    "messages": self._mark_history_cache(messages)
                 }
 
                 if system_prompt:
@@ -199,6 +235,57 @@ class AnthropicService:
             f"API call failed after {max_retries} attempts: {last_error}"
         )
 
+    async def generate_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[Union[str, List[Dict]]] = None,
+        max_tokens: int = 200,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """Stream a response from the Claude API, yielding text deltas.
+
+        Cuts perceived latency from full-generation time to
+        time-to-first-token; usage/cost tracking happens once the
+        stream completes.
+
+        Args:
+            messages: List of conversation messages
+            system_prompt: Optional system prompt (string or blocks)
+            max_tokens: Maximum tokens to generate
+            temperature: Response randomness (0-1)
+
+        Yields:
+            Text deltas as they arrive from the API
+
+        Raises:
+            AnthropicError: If the streaming call fails
+        """
+        call_params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": self._mark_history_cache(messages)
+        }
+        if system_prompt:
+            call_params["system"] = system_prompt
+
+        try:
+            async with self.client.messages.stream(**call_params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                response = await stream.get_final_message()
+
+            # Track usage from the completed stream
+            input_tokens = response.usage.input_tokens
+            output_tokens = response.usage.output_tokens
+            call_cost = calculate_cost(self.model, input_tokens, output_tokens)
+
+            self.total_tokens += input_tokens + output_tokens
+            self.total_cost += call_cost
+            self.session_cost += call_cost
+        except Exception as e:
+            raise AnthropicError(f"Streaming API call failed: {e}")
+
     def reset_session_cost(self) -> float:
         """Reset session cost tracking and return previous value."""
         previous_cost = self.session_cost
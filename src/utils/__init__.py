@@ -7,11 +7,13 @@ from .async_helpers import (
     AsyncResourceManager,
     safe_gather
 )
+from .serialization import to_json
 
 __all__ = [
     "async_retry",
-    "gather_with_timeout", 
+    "gather_with_timeout",
     "async_timeout",
     "AsyncResourceManager",
-    "safe_gather"
-]
\ No newline at end of file
+    "safe_gather",
+    "to_json"
+]
@@ -0,0 +1,35 @@
+"""Fast JSON serialization helpers for the response path.
+
+Uses orjson when available (3-10x faster than stdlib json, handles
+datetime natively) and falls back to a pre-built stdlib encoder that
+coerces non-JSON types through str().
+"""
+
+import json
+
+# Try to import orjson for faster serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Pre-built stdlib encoder: compact separators, datetime via default=str
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def to_json(obj) -> str:
+    """Serialize an object to a JSON string.
+
+    Handles datetime values without callers needing to .isoformat()
+    them manually.
+
+    Args:
+        obj: Any JSON-serializable structure (dicts, lists, datetimes)
+
+    Returns:
+        Compact JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+    return _ENCODER(obj)
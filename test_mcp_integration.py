@@ -59,17 +59,19 @@ async def test_mcp_integration():
     # Test system prompt enhancement
     print("=== Testing System Prompt Enhancement ===")
     try:
-        enhanced_prompt = coach._get_system_prompt_with_context(todo_context)
+        system_blocks = coach._get_system_blocks(todo_context)
+        enhanced_prompt = "\n\n".join(block["text"] for block in system_blocks)
         base_prompt = coach._get_system_prompt()
-        
+
         print(f"Base prompt length: {len(base_prompt)} characters")
         print(f"Enhanced prompt length: {len(enhanced_prompt)} characters")
+        print(f"System blocks: {len(system_blocks)}")
         print(f"Prompt was enhanced: {len(enhanced_prompt) > len(base_prompt)}")
-        
+
         if todo_context and len(enhanced_prompt) > len(base_prompt):
             print("✅ System prompt enhancement is working!")
             print("\nEnhanced section:")
-            enhancement = enhanced_prompt[len(base_prompt):]
+            enhancement = system_blocks[-1]["text"]
             print(enhancement[:200] + "..." if len(enhancement) > 200 else enhancement)
         else:
             print("ℹ️ System prompt not enhanced (expected if no todos)")
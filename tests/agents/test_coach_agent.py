@@ -9,6 +9,13 @@ from src.agents.base import AgentRequest
 from src.services.llm_service import AnthropicService
 
 
+def _system_text(system_prompt):
+    """Flatten a system prompt (string or content blocks) to plain text."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block["text"] for block in system_prompt)
+
+
 class TestDiaryCoach:
     """Test suite for DiaryCoach agent."""
 
@@ -161,7 +168,7 @@ class TestDiaryCoach:
         # Verify the system prompt was used
         call_args = mock_llm_service.generate_response.call_args
         assert call_args[1]["system_prompt"] is not None
-        system_prompt = call_args[1]["system_prompt"]
+        system_prompt = _system_text(call_args[1]["system_prompt"])
         
         # Should contain key elements from the prompt
         assert "Daily Transformation Diary Coach" in system_prompt
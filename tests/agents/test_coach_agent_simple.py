@@ -66,4 +66,28 @@ class TestDiaryCoachSimple:
         # Verify we have all 6 messages in history
         assert len(coach.message_history) == 6  # 3 user + 3 assistant messages
         assert response3.agent_name == "coach"
-        assert response3.content is not None
\ No newline at end of file
+        assert response3.content is not None
+
+    @pytest.mark.asyncio
+    async def test_history_trims_without_initialize(
+        self, coach, mock_llm_service
+    ):
+        """History housekeeping runs even when initialize() was never
+        called, as in eval harnesses that construct the coach directly."""
+        mock_llm_service.generate_response.return_value = "Noted."
+
+        for i in range(coach.HISTORY_LIMIT + 2):
+            coach.message_history.append(
+                {"role": "user", "content": f"Message {i}"}
+            )
+        coach._enqueue_history({"role": "user", "content": "latest"})
+
+        # Let the lazily started housekeeper drain the queue
+        await coach._history_queue.join()
+
+        assert coach._housekeeper is not None
+        assert len(coach.message_history) == coach.HISTORY_LIMIT
+        assert coach.history_summary is not None
+        assert "Message 0" in coach.history_summary
+
+        await coach.shutdown()
@@ -66,7 +66,7 @@ async def test_enhanced_coach_initialization(mock_llm_service):
     
     assert coach.name == "coach"
     assert coach.max_agent_calls_per_turn == 2
-    assert len(coach.recent_agent_calls) == 0
+    assert coach._agent_cooldown == {}
     
     await coach.initialize()
     assert coach.is_initialized
@@ -77,15 +77,15 @@ async def test_should_call_memory_agent(mock_llm_service):
     coach = EnhancedDiaryCoach(mock_llm_service)
     
     # Should trigger
-    assert await coach._should_call_agent("memory", "Remember when we discussed this?")
-    assert await coach._should_call_agent("memory", "Last time you mentioned something")
+    assert coach._should_call_agent("memory", "Remember when we discussed this?")
+    assert coach._should_call_agent("memory", "Last time you mentioned something")
     
     # Should not trigger
-    assert not await coach._should_call_agent("memory", "What should I do today?")
+    assert not coach._should_call_agent("memory", "What should I do today?")
     
     # Should not trigger if recently called
-    coach.recent_agent_calls.add("memory")
-    assert not await coach._should_call_agent("memory", "Remember when we talked?")
+    coach._agent_cooldown["memory"] = coach._turn_counter
+    assert not coach._should_call_agent("memory", "Remember when we talked?")
 
 @pytest.mark.asyncio
 async def test_should_call_personal_content_agent(mock_llm_service):
@@ -93,11 +93,11 @@ async def test_should_call_personal_content_agent(mock_llm_service):
     coach = EnhancedDiaryCoach(mock_llm_service)
     
     # Should trigger
-    assert await coach._should_call_agent("personal_content", "What are my core beliefs?")
-    assert await coach._should_call_agent("personal_content", "This goes against my values")
+    assert coach._should_call_agent("personal_content", "What are my core beliefs?")
+    assert coach._should_call_agent("personal_content", "This goes against my values")
     
     # Should not trigger
-    assert not await coach._should_call_agent("personal_content", "What time is it?")
+    assert not coach._should_call_agent("personal_content", "What time is it?")
 
 @pytest.mark.asyncio
 async def test_should_call_mcp_agent(mock_llm_service):
@@ -105,12 +105,12 @@ async def test_should_call_mcp_agent(mock_llm_service):
     coach = EnhancedDiaryCoach(mock_llm_service)
     
     # Should trigger
-    assert await coach._should_call_agent("mcp", "What should I work on today?")
-    assert await coach._should_call_agent("mcp", "What are my priorities?")
-    assert await coach._should_call_agent("mcp", "Any important deadlines?")
+    assert coach._should_call_agent("mcp", "What should I work on today?")
+    assert coach._should_call_agent("mcp", "What are my priorities?")
+    assert coach._should_call_agent("mcp", "Any important deadlines?")
     
     # Should not trigger
-    assert not await coach._should_call_agent("mcp", "I'm feeling overwhelmed")
+    assert not coach._should_call_agent("mcp", "I'm feeling overwhelmed")
 
 @pytest.mark.asyncio
 async def test_enhance_prompt_with_context(mock_llm_service):
@@ -137,16 +137,19 @@ async def test_enhance_prompt_with_context(mock_llm_service):
     assert "Integrate this real data naturally" in enhanced
 
 @pytest.mark.asyncio
-async def test_recent_calls_cleared_periodically(mock_llm_service):
-    """Test that recent agent calls are cleared periodically."""
+async def test_agent_cooldown_expires_per_agent(mock_llm_service):
+    """Test that each agent becomes callable again after its cooldown."""
     coach = EnhancedDiaryCoach(mock_llm_service)
     mock_llm_service.generate_response.return_value = "Response"
-    
-    # Add some recent calls
-    coach.recent_agent_calls.add("memory")
-    coach.recent_agent_calls.add("mcp")
-    
-    # Process 3 exchanges (6 messages total)
+
+    # Simulate agents called on the current turn
+    coach._agent_cooldown["memory"] = coach._turn_counter
+    coach._agent_cooldown["mcp"] = coach._turn_counter
+
+    # Within the cooldown window, triggers are suppressed
+    assert not coach._should_call_agent("memory", "Remember when we talked?")
+
+    # Process 3 exchanges
     for i in range(3):
         message = UserMessage(
             content=f"Message {i}",
@@ -156,9 +159,9 @@ async def test_recent_calls_cleared_periodically(mock_llm_service):
             timestamp=datetime.now()
         )
         await coach.process_message(message)
-    
-    # Recent calls should be cleared after 3 turns
-    assert len(coach.recent_agent_calls) == 0
+
+    # Cooldown has lapsed; triggering messages fire again
+    assert coach._should_call_agent("memory", "Remember when we talked?")
 
 @pytest.mark.asyncio
 async def test_no_agent_calls_for_emotional_content(mock_llm_service, mock_agents):
@@ -177,8 +180,31 @@ async def test_no_agent_calls_for_emotional_content(mock_llm_service, mock_agent
     response = await coach.process_message(message)
     
     # No agents should be called
-    assert coach._last_response_metadata["agents_called"] == []
-    assert coach._last_response_metadata["agent_calls_made"] == 0
+    assert coach._last_response_metadata.agents_called == []
+    assert coach._last_response_metadata.agent_calls_made == 0
+
+@pytest.mark.asyncio
+async def test_phase2_accepts_punctuated_affirmation(mock_llm_service):
+    """Test that 'Yes!' still triggers the phase 2 reporter path."""
+    coach = EnhancedDiaryCoach(mock_llm_service)
+    coach.conversation_state = "morning"
+    coach.crux_identified = True
+    coach.message_history = [{
+        "role": "assistant",
+        "content": "Would you like deeper questions about this crux?"
+    }]
+
+    message = UserMessage(
+        content="Yes!",
+        user_id="test",
+        conversation_id="test123",
+        message_id="msg1",
+        timestamp=datetime.now()
+    )
+
+    assert coach._should_consult_reporter_for_phase2(message, "yes!")
+    assert coach._should_consult_reporter_for_phase2(message, "okay.")
+    assert not coach._should_consult_reporter_for_phase2(message, "not yet")
 
 @pytest.mark.asyncio
 async def test_handle_request_conversion(mock_llm_service):
@@ -289,6 +289,41 @@ async def test_overdue_filter(mock_mcp_node):
     assert call_args[0][1] == "overdue"
 
 
+@pytest.mark.asyncio
+async def test_handle_requests_batch(mock_mcp_node, mock_todos):
+    """Test concurrent dispatch of multiple MCP requests."""
+    mock_state = ContextState()
+    mock_state.todo_context = [mock_todos[0]]
+    mock_state.context_usage = {"todos_fetched": True}
+    mock_mcp_node.fetch_todos.return_value = mock_state
+
+    agent = MCPAgent()
+    agent.mcp_node = mock_mcp_node
+    agent.connection_status = {"connected": True}
+
+    requests = [
+        AgentRequest(
+            from_agent="coach",
+            to_agent="mcp",
+            query="What tasks are due today?",
+            context={}
+        ),
+        AgentRequest(
+            from_agent="coach",
+            to_agent="mcp",
+            query="Show me overdue tasks",
+            context={}
+        )
+    ]
+
+    responses = await agent.handle_requests_batch(requests)
+
+    assert len(responses) == 2
+    assert all(response.agent_name == "mcp" for response in responses)
+    assert not any(response.error for response in responses)
+    assert mock_mcp_node.fetch_todos.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_task_limit_to_five(mock_mcp_node):
     """Test that only top 5 tasks are shown."""
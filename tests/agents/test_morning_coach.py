@@ -8,6 +8,13 @@ from src.events.schemas import UserMessage, AgentResponse
 from src.services.llm_service import AnthropicService
 
 
+def _system_text(system_prompt):
+    """Flatten a system prompt (string or content blocks) to plain text."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block["text"] for block in system_prompt)
+
+
 class TestMorningCoach:
     """Test suite for Morning Coach specific behaviors."""
 
@@ -105,7 +112,7 @@ class TestMorningCoach:
             
             # Verify morning-specific system prompt was used
             call_args = mock_llm_service.generate_response.call_args
-            system_prompt = call_args[1]["system_prompt"]
+            system_prompt = _system_text(call_args[1]["system_prompt"])
             
             # Should contain morning-specific elements
             morning_indicators = [
@@ -134,7 +141,7 @@ class TestMorningCoach:
             
             # Verify standard system prompt was used (not morning-specific)
             call_args = mock_llm_service.generate_response.call_args
-            system_prompt = call_args[1]["system_prompt"]
+            system_prompt = _system_text(call_args[1]["system_prompt"])
             
             # Should NOT contain morning-specific elements in evening
             assert "Morning Ritual Protocol" not in system_prompt
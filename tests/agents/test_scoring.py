@@ -0,0 +1,36 @@
+"""Tests for batch keyword relevance scoring helpers."""
+
+import numpy as np
+
+from src.agents._scoring import score, score_batch
+
+
+def test_score_batch_caps_at_one():
+    """Scores are capped at 1.0 no matter how many keywords match."""
+    matches = np.ones((3, 10), dtype=np.uint8)
+    scores = score_batch(matches, weight=0.3)
+
+    assert scores.shape == (3,)
+    assert np.all(scores == 1.0)
+
+
+def test_score_batch_partial_matches():
+    """Uncapped rows score matches times weight."""
+    matches = np.array([
+        [1, 0, 0, 0],
+        [1, 1, 0, 0],
+        [0, 0, 0, 0],
+    ], dtype=np.uint8)
+    scores = score_batch(matches, weight=0.3)
+
+    assert np.allclose(scores, [0.3, 0.6, 0.0])
+
+
+def test_score_matches_score_batch_rowwise():
+    """The scalar scorer agrees with the batch scorer per row."""
+    rng = np.random.default_rng(42)
+    matches = (rng.random((20, 8)) > 0.5).astype(np.uint8)
+    batch_scores = score_batch(matches, weight=0.3)
+
+    for row, expected in zip(matches, batch_scores):
+        assert abs(score(row, 0.3) - expected) < 1e-9
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 from src.events.redis_bus import RedisEventBus
 import redis.asyncio as redis
@@ -60,7 +61,10 @@ async def test_redis_bus_publish():
     await bus.publish("test_channel", {"test": "data"})
     
     # Verify Redis publish was called with JSON serialized data
-    mock_redis.publish.assert_called_once_with("test_channel", '{"test": "data"}')
+    mock_redis.publish.assert_called_once()
+    channel, event_data = mock_redis.publish.call_args[0]
+    assert channel == "test_channel"
+    assert json.loads(event_data) == {"test": "data"}
     
     await bus.close()
 
@@ -121,4 +121,64 @@ class TestAnthropicService:
         assert response1 == "First response"
         assert response2 == "Second response"
         assert service.total_tokens == 30  # (10+5) + (8+7)
-        assert service.session_cost > 0
\ No newline at end of file
+        assert service.session_cost > 0
+
+    @pytest.mark.asyncio
+    async def test_anthropic_service_streaming(self):
+        """Test streaming call yields deltas and tracks usage."""
+        service = AnthropicService(api_key="test")
+
+        # Mock the streaming context manager and its text stream
+        mock_final = MagicMock()
+        mock_final.usage.input_tokens = 12
+        mock_final.usage.output_tokens = 6
+
+        async def fake_text_stream():
+            for delta in ["Hel", "lo ", "there"]:
+                yield delta
+
+        mock_stream = MagicMock()
+        mock_stream.text_stream = fake_text_stream()
+        mock_stream.get_final_message = AsyncMock(return_value=mock_final)
+
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_stream)
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        service.client.messages.stream = MagicMock(return_value=mock_ctx)
+
+        deltas = []
+        async for delta in service.generate_response_stream(
+            messages=[{"role": "user", "content": "Hello"}]
+        ):
+            deltas.append(delta)
+
+        assert "".join(deltas) == "Hello there"
+        assert service.total_tokens == 18  # 12 + 6
+        assert service.session_cost > 0
+
+    @pytest.mark.asyncio
+    async def test_history_prefix_marked_cacheable(self):
+        """Test second-to-last message gets a cache_control breakpoint."""
+        service = AnthropicService(api_key="test")
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Reply")]
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 5
+        service.client.messages.create = AsyncMock(return_value=mock_response)
+
+        await service.generate_response(messages=[
+            {"role": "user", "content": "First turn"},
+            {"role": "assistant", "content": "First reply"},
+            {"role": "user", "content": "Second turn"}
+        ])
+
+        sent = service.client.messages.create.call_args[1]["messages"]
+        assert sent[1]["content"] == [{
+            "type": "text",
+            "text": "First reply",
+            "cache_control": {"type": "ephemeral"}
+        }]
+        # The new message and earlier prefix entries are untouched
+        assert sent[0]["content"] == "First turn"
+        assert sent[2]["content"] == "Second turn"
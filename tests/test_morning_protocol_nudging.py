@@ -11,6 +11,13 @@ from src.agents.enhanced_coach_agent import EnhancedDiaryCoach
 from src.services.llm_service import AnthropicService
 
 
+def _system_text(system_prompt):
+    """Flatten a system prompt (string or content blocks) to plain text."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block["text"] for block in system_prompt)
+
+
 class TestProtocolNudgingPerformance:
     """Test that nudging logic is blazingly fast."""
     
@@ -95,7 +102,8 @@ class TestNudgeDelivery:
         await coach.handle_request(message1)
         
         # Check first call - no nudge yet
-        first_call_prompt = mock_llm.generate_response.call_args[1]['system_prompt']
+        first_call_prompt = _system_text(
+            mock_llm.generate_response.call_args[1]['system_prompt'])
         assert "[NUDGE:" not in first_call_prompt
         
         # Second message stating a problem
@@ -122,7 +130,8 @@ class TestNudgeDelivery:
         
         # Check that nudge was added to prompt
         if mock_llm.generate_response.call_count >= 3:
-            third_call_prompt = mock_llm.generate_response.call_args[1]['system_prompt']
+            third_call_prompt = _system_text(
+                mock_llm.generate_response.call_args[1]['system_prompt'])
             # Should have nudge about moving to crux identification
             assert "[NUDGE:" in third_call_prompt or "crux" in third_call_prompt.lower()
     
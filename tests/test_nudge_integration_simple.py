@@ -9,6 +9,13 @@ from src.agents.base import AgentRequest
 from src.services.llm_service import AnthropicService
 
 
+def _system_text(system_prompt):
+    """Flatten a system prompt (string or content blocks) to plain text."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block["text"] for block in system_prompt)
+
+
 @pytest.mark.asyncio
 async def test_nudges_reach_llm():
     """Test that nudges are actually included in the LLM prompt."""
@@ -20,7 +27,7 @@ async def test_nudges_reach_llm():
     mock_llm = AsyncMock(spec=AnthropicService)
     
     async def capture_prompt(**kwargs):
-        captured_prompts.append(kwargs.get('system_prompt', ''))
+        captured_prompts.append(_system_text(kwargs.get('system_prompt', '')))
         return "Coach response mentioning the crux is unclear priorities"
     
     mock_llm.generate_response = capture_prompt